@@ -2,4 +2,11 @@ from django.apps import AppConfig
 
 
 class ApiConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .util.cloudinary_client import configure_cloudinary
+
+        configure_cloudinary()
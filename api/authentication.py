@@ -1,7 +1,23 @@
+from django.conf import settings
+from rest_framework import permissions
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework.exceptions import AuthenticationFailed
 
+from .util.token_cache import token_cache
+
+# Permissions under which a safe request is answered the same for everyone.
+PUBLIC_READ_PERMISSIONS = (permissions.AllowAny, permissions.IsAuthenticatedOrReadOnly)
+
+
+def is_public_read(request):
+    """True for a safe request to a view that anyone may read."""
+    view = request.parser_context.get('view') if request.parser_context else None
+    if view is None or request.method not in permissions.SAFE_METHODS:
+        return False
+    return all(isinstance(permission, PUBLIC_READ_PERMISSIONS) for permission in view.get_permissions())
+
+
 class SafeJWTAuthentication(JWTAuthentication):
     """
     Custom JWT Authentication class that fails gracefully.
@@ -9,9 +25,38 @@ class SafeJWTAuthentication(JWTAuthentication):
     instead of raising a 401 Unauthorized error.
     This allows public endpoints to remain accessible even if the client
     sends a stale token.
+
+    Verified tokens are kept in a short-lived per-worker cache
+    (api/util/token_cache.py), so repeat requests skip the signature check
+    and the user query, and tokens whose (unverified) exp has passed are
+    turned away before any verification. With
+    API_AUTH['SKIP_ON_PUBLIC_READS'], safe requests to public views are not
+    authenticated at all.
     """
     def authenticate(self, request):
+        if getattr(settings, 'API_AUTH', {}).get('SKIP_ON_PUBLIC_READS') and is_public_read(request):
+            return None
+
         try:
-            return super().authenticate(request)
+            header = self.get_header(request)
+            if header is None:
+                return None
+            raw_token = self.get_raw_token(header)
+            if raw_token is None:
+                return None
+
+            cached = token_cache.get(raw_token)
+            if cached is not None:
+                return cached
+            # Stale tokens (old tabs, replaying bots) end up anonymous anyway;
+            # skip decoding, verifying and raising for them.
+            if token_cache.is_expired(raw_token):
+                return None
+
+            validated_token = self.get_validated_token(raw_token)
+            user = self.get_user(validated_token)
         except (InvalidToken, TokenError, AuthenticationFailed):
             return None
+
+        token_cache.set(raw_token, validated_token, user)
+        return user, validated_token
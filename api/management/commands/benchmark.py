@@ -0,0 +1,324 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from contextlib import contextmanager
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import AsyncRequestFactory, RequestFactory
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from api.models import Certification, ContactInfo, Education, Experience, Profile, Project, Skill
+from api.serializers import (
+    CertificationSerializer, ContactInfoSerializer, EducationSerializer, ExperienceSerializer,
+    ProfileSerializer, ProjectSerializer, SkillSerializer,
+)
+from api.util.async_reads import hybrid_view
+from api.util.base_serializer import get_error_message, get_values_serializer, serialize_list
+from api.util.renderers import FastJSONRenderer, orjson
+from api.util.responses import APIResponse
+from api.util.throttling import ContactRateThrottle, LocalBucketStore
+from api.views import SkillView
+
+# Same sections as PortfolioView
+PORTFOLIO_SECTIONS = {
+    'profiles': (Profile, ProfileSerializer),
+    'skills': (Skill, SkillSerializer),
+    'experiences': (Experience, ExperienceSerializer),
+    'projects': (Project, ProjectSerializer),
+    'certifications': (Certification, CertificationSerializer),
+    'education': (Education, EducationSerializer),
+    'contactinfo': (ContactInfo, ContactInfoSerializer),
+}
+
+
+def build_synthetic_rows(rows):
+    """Unsaved instances shaped like a filled-in portfolio, for an empty database."""
+    now = timezone.now()
+    start = date(2020, 1, 1)
+    url = 'https://res.cloudinary.com/demo/image/upload/v1/portfolio/sample.png'
+    variants = {'webp': {'320': url, '640': url}, 'avif': {'320': url, '640': url}}
+    return {
+        'profiles': [Profile(
+            id=1, name='Jane Doe', title='Backend Engineer', bio='Bio ' * 50,
+            profile_picture=url, profile_picture_variants=variants, resume=url,
+            email='jane@example.com', phone='+10000000000', address='Somewhere',
+            created_at=now, modified_at=now,
+        )],
+        'skills': [Skill(
+            id=i, name=f'Skill {i}', percentage=i % 100, category='WEB',
+            created_at=now, modified_at=now,
+        ) for i in range(rows)],
+        'experiences': [Experience(
+            id=i, company_name=f'Company {i}', role='Engineer', description='Did things. ' * 20,
+            start_date=start + timedelta(days=i), end_date=start + timedelta(days=i + 300),
+            logo=url, logo_variants=variants, created_at=now, modified_at=now,
+        ) for i in range(rows)],
+        'projects': [Project(
+            id=i, title=f'Project {i}', description='Built things. ' * 20, image=url,
+            image_variants=variants, tech_stack='Django, DRF, PostgreSQL',
+            github_link='https://github.com/example/project',
+            created_at=now, modified_at=now,
+        ) for i in range(rows)],
+        'certifications': [Certification(
+            id=i, title=f'Certification {i}', image=url, image_variants=variants, pdf_file=url,
+            created_at=now, modified_at=now,
+        ) for i in range(rows)],
+        'education': [Education(
+            id=i, institution=f'University {i}', degree='BSc', description='Studied. ' * 10,
+            start_date=start, end_date=start + timedelta(days=1200),
+            created_at=now, modified_at=now,
+        ) for i in range(rows)],
+        'contactinfo': [ContactInfo(
+            id=1, email='jane@example.com', phone='+10000000000', address='Somewhere',
+            description='Get in touch.', created_at=now, modified_at=now,
+        )],
+    }
+
+
+def legacy_get_error_message(serializer_errors, error_messages_dict):
+    """get_error_message as it was before the lookup tables, as the baseline."""
+    error_field = next(iter(serializer_errors))
+    raw = next(iter(serializer_errors.values()))[0]
+    try:
+        messages = {
+            f"{error_field}_null": f"{error_field} should not be null.",
+            f"{error_field}_required": f"Key : {error_field} is missing.",
+            f"{error_field}_blank": f"Please enter value for {error_field}.",
+            f"{error_field}_invalid": f"Please enter a valid value for Field : {error_field}.",
+            f"{error_field}_does_not_exist": "No record found.",
+            f"{error_field}_incorrect_type": f"Please enter a valid value for Field : {error_field}.",
+            f"{error_field}_min_value": "Please enter a value greater than min value.",
+            f"{error_field}_max_value": f"You have exceeded the maximum value for {error_field}",
+            f"{error_field}_max_length": f"You have exceeded the maximum length for {error_field}",
+        } | error_messages_dict
+        friendly = messages[raw]
+    except Exception:
+        friendly = raw
+    return raw, friendly, error_field
+
+
+class Command(BaseCommand):
+    help = "Micro-benchmarks of the API's hot paths. Run a single section with --section."
+
+    # section name -> method; each prints its own timings
+    sections = {
+        'render': 'bench_render',
+        'serialize': 'bench_serialize',
+        'errors': 'bench_errors',
+        'async': 'bench_async',
+        'throttle': 'bench_throttle',
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument('--section', choices=sorted(self.sections), action='append',
+                            help="Section to run (repeatable). Defaults to all sections.")
+        parser.add_argument('--iterations', type=int, default=200)
+        parser.add_argument('--rows', type=int, default=0,
+                            help="Use N synthetic rows per section instead of the database contents.")
+        parser.add_argument('--concurrency', type=int, default=32,
+                            help="Requests in flight at once for the async section.")
+
+    def handle(self, *args, **options):
+        self.iterations = options['iterations']
+        self.rows = options['rows']
+        self.concurrency = options['concurrency']
+        for name in options['section'] or list(self.sections):
+            self.stdout.write(self.style.MIGRATE_HEADING(f"== {name} =="))
+            getattr(self, self.sections[name])()
+
+    # -------------------------
+    # Helpers
+    # -------------------------
+    def get_portfolio_rows(self):
+        if self.rows:
+            return build_synthetic_rows(self.rows)
+        rows = {name: list(model.objects.all()) for name, (model, _) in PORTFOLIO_SECTIONS.items()}
+        if not any(rows.values()):
+            raise CommandError("The database has no portfolio data; pass --rows N for synthetic data.")
+        return rows
+
+    def get_portfolio_envelope(self):
+        rows = self.get_portfolio_rows()
+        document = {
+            name: serializer_class(rows[name], many=True).data
+            for name, (_, serializer_class) in PORTFOLIO_SECTIONS.items()
+        }
+        return APIResponse.get_success_response(APIResponse.Codes.PORTFOLIO_RETRIEVED, document).data
+
+    @contextmanager
+    def portfolio_in_database(self):
+        """
+        With --rows, insert the synthetic rows for the duration of the block
+        and roll them back afterwards; otherwise use the database as it is.
+        """
+        if not self.rows:
+            yield
+            return
+        with transaction.atomic():
+            for name, rows in build_synthetic_rows(self.rows).items():
+                for row in rows:
+                    row.pk = None
+                PORTFOLIO_SECTIONS[name][0].objects.bulk_create(rows)
+            yield
+            transaction.set_rollback(True)
+
+    def timeit(self, label, func, baseline=None, iterations=None):
+        iterations = iterations or self.iterations
+        func()  # warm up
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        per_call = (time.perf_counter() - started) / iterations * 1000
+        speedup = f"  ({baseline / per_call:.1f}x)" if baseline else ""
+        self.stdout.write(f"  {label:<32} {per_call:9.4f} ms{speedup}")
+        return per_call
+
+    # -------------------------
+    # Sections
+    # -------------------------
+    def bench_render(self):
+        """Encoding the full portfolio envelope: DRF's JSONRenderer vs FastJSONRenderer."""
+        envelope = self.get_portfolio_envelope()
+        stock, fast = JSONRenderer(), FastJSONRenderer()
+        if orjson is None:
+            self.stdout.write(self.style.WARNING("  orjson is not installed; FastJSONRenderer falls back to json"))
+        elif json.loads(stock.render(envelope)) != json.loads(fast.render(envelope)):
+            raise CommandError("FastJSONRenderer output differs from JSONRenderer")
+
+        self.stdout.write(f"  payload: {len(stock.render(envelope))} bytes")
+        baseline = self.timeit('JSONRenderer (json)', lambda: stock.render(envelope))
+        self.timeit('FastJSONRenderer (orjson)', lambda: fast.render(envelope), baseline)
+
+    def bench_serialize(self):
+        """
+        List serialization of every portfolio section: ModelSerializer over model
+        instances vs ValuesSerializer over .values() rows. Both include the query.
+        Try it at scale with --rows 10000. That both produce the same output is
+        checked by ValuesSerializerParityTests in api/tests.py.
+        """
+        # Each call serializes a whole table, so run fewer of them.
+        iterations = max(1, self.iterations // 20)
+        with self.portfolio_in_database():
+            for name, (model, serializer_class) in PORTFOLIO_SECTIONS.items():
+                queryset = model.objects.order_by('-created_at', '-id')
+                if get_values_serializer(serializer_class) is None:
+                    self.stdout.write(f"  {name}: not supported by ValuesSerializer, skipped")
+                    continue
+
+                self.stdout.write(f"  {name} ({queryset.count()} rows)")
+                baseline = self.timeit(
+                    'ModelSerializer', lambda: serializer_class(queryset, many=True).data,
+                    iterations=iterations,
+                )
+                self.timeit(
+                    'ValuesSerializer', lambda: serialize_list(queryset, serializer_class),
+                    baseline, iterations=iterations,
+                )
+
+    def bench_errors(self):
+        """
+        Mapping a validation error to its friendly message, as done by
+        APIResponse.get_validation_error_response for every rejected request.
+        """
+        cases = {
+            'known code': {'email': ['email_invalid']},
+            'custom message': {'message': ['message_spam']},
+            'free text': {'email': ['Enter a valid email address.']},
+        }
+        custom = {'message_spam': "Your message looks like spam."}
+        for label, errors in cases.items():
+            if get_error_message(errors, custom) != legacy_get_error_message(errors, custom):
+                raise CommandError(f"get_error_message result differs for {label}")
+            self.stdout.write(f"  {label}")
+            baseline = self.timeit('rebuilt dict per error', lambda: legacy_get_error_message(errors, custom),
+                                   iterations=self.iterations * 100)
+            self.timeit('lookup tables', lambda: get_error_message(errors, custom), baseline,
+                        iterations=self.iterations * 100)
+
+    def bench_async(self):
+        """
+        Throughput of GET /api/skills/ with --concurrency requests in flight:
+        the sync view on a thread pool (WSGI worker threads) vs the native
+        async view on one event loop (ASGI). Uses the database as it is; the
+        async ORM runs outside the --rows transaction.
+        """
+        path = '/api/skills/'
+        total = self.iterations * 5
+
+        sync_view = SkillView.as_view()
+        sync_factory = RequestFactory()
+        expected = sync_view(sync_factory.get(path)).content
+
+        def sync_request():
+            try:
+                return sync_view(sync_factory.get(path)).content
+            finally:
+                connection.close()
+
+        def run_sync():
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                return list(executor.map(lambda _: sync_request(), range(total)))
+
+        async_view = hybrid_view(SkillView)
+        async_factory = AsyncRequestFactory()
+
+        async def run_async():
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def async_request():
+                async with semaphore:
+                    return (await async_view(async_factory.get(path))).content
+
+            return await asyncio.gather(*(async_request() for _ in range(total)))
+
+        for label, run in (('sync views, threads', run_sync),
+                           ('async views, event loop', lambda: asyncio.run(run_async()))):
+            run()  # warm up
+            started = time.perf_counter()
+            bodies = run()
+            elapsed = time.perf_counter() - started
+            if any(body != expected for body in bodies):
+                raise CommandError(f"{label}: response differs from the sync view")
+            self.stdout.write(f"  {label:<32} {total / elapsed:9.1f} req/s")
+
+    def bench_throttle(self):
+        """
+        Per-request cost of the contact form rate limiter (in-process buckets):
+        a client within its limit, a client being turned away, and a flood of
+        distinct clients that keeps creating and evicting buckets.
+        """
+        factory = RequestFactory()
+
+        def contact_request(ip):
+            request = Request(
+                factory.post('/api/contacts/', {'email': f'{ip}@example.com', 'message': 'Hi'},
+                             content_type='application/json', REMOTE_ADDR=ip),
+                parsers=[JSONParser()],
+            )
+            request.data  # parsed once, as the view would
+            return request
+
+        throttle = ContactRateThrottle()
+        throttle.shared = None
+        throttle.local = LocalBucketStore(max_entries=10000)
+        requests = [contact_request(f'10.0.{i // 256}.{i % 256}') for i in range(20000)]
+        iterations = self.iterations * 100
+
+        throttle.capacity, throttle.refill_rate = float('inf'), 1.0
+        self.timeit('allowed', lambda: throttle.allow_request(requests[0], None), iterations=iterations)
+
+        throttle.capacity, throttle.refill_rate = 1, 1e-9
+        if throttle.allow_request(requests[1], None) and throttle.allow_request(requests[1], None):
+            raise CommandError("The limiter let a second request through an empty bucket")
+        self.timeit('rejected', lambda: throttle.allow_request(requests[1], None), iterations=iterations)
+
+        clients = iter(requests * (iterations // len(requests) + 2))
+        self.timeit('distinct clients (evicting)', lambda: throttle.allow_request(next(clients), None),
+                    iterations=iterations)
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from api.models import MediaAsset
+from api.util.storage import dedup_report
+
+
+class Command(BaseCommand):
+    help = "Report stored media assets and the upload bytes saved by content deduplication."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=10, help="Number of most reused assets to list.")
+
+    def handle(self, *args, **options):
+        report = dedup_report()
+        self.stdout.write(f"Assets stored:     {report['assets']}")
+        self.stdout.write(f"Bytes stored:      {report['stored_bytes']}")
+        self.stdout.write(f"Uploads reused:    {report['reuses']}")
+        self.stdout.write(self.style.SUCCESS(f"Bytes saved:       {report['bytes_saved']}"))
+
+        top = MediaAsset.objects.filter(reuse_count__gt=0).order_by('-bytes_saved')[:options['top']]
+        if top:
+            self.stdout.write("\nMost reused assets:")
+            for asset in top:
+                self.stdout.write(
+                    f"  {asset.public_id}: reused {asset.reuse_count}x, {asset.bytes_saved} bytes saved"
+                )
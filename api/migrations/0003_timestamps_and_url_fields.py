@@ -0,0 +1,168 @@
+# Generated by Django 6.0.1 on 2026-10-18 08:42
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class AddFieldIfMissing(migrations.AddField):
+    """
+    AddField that leaves an existing column alone.
+
+    These columns were in the models (and in deployed databases) before they
+    had a migration, so on such databases only the migration state is
+    updated; fresh databases get the columns created as usual.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        column = model._meta.get_field(self.name).column
+        with schema_editor.connection.cursor() as cursor:
+            columns = {
+                info.name for info in
+                schema_editor.connection.introspection.get_table_description(cursor, model._meta.db_table)
+            }
+        if column not in columns:
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_contactinfo'),
+    ]
+
+    operations = [
+        AddFieldIfMissing(
+            model_name='certification',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        AddFieldIfMissing(
+            model_name='certification',
+            name='modified_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        AddFieldIfMissing(
+            model_name='contact',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        AddFieldIfMissing(
+            model_name='contact',
+            name='modified_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        AddFieldIfMissing(
+            model_name='contactinfo',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        AddFieldIfMissing(
+            model_name='contactinfo',
+            name='modified_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        AddFieldIfMissing(
+            model_name='education',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        AddFieldIfMissing(
+            model_name='education',
+            name='modified_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        AddFieldIfMissing(
+            model_name='experience',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        AddFieldIfMissing(
+            model_name='experience',
+            name='modified_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        AddFieldIfMissing(
+            model_name='profile',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        AddFieldIfMissing(
+            model_name='profile',
+            name='modified_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        AddFieldIfMissing(
+            model_name='project',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        AddFieldIfMissing(
+            model_name='project',
+            name='live_url',
+            field=models.URLField(blank=True, null=True),
+        ),
+        AddFieldIfMissing(
+            model_name='project',
+            name='modified_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        AddFieldIfMissing(
+            model_name='project',
+            name='tech_stack',
+            field=models.CharField(blank=True, max_length=200, null=True),
+        ),
+        AddFieldIfMissing(
+            model_name='skill',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        AddFieldIfMissing(
+            model_name='skill',
+            name='modified_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AlterField(
+            model_name='certification',
+            name='image',
+            field=models.URLField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='certification',
+            name='pdf_file',
+            field=models.URLField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='experience',
+            name='logo',
+            field=models.URLField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='profile',
+            name='profile_picture',
+            field=models.URLField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='profile',
+            name='resume',
+            field=models.URLField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='github_link',
+            field=models.URLField(blank=True),
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='image',
+            field=models.URLField(blank=True, null=True),
+        ),
+    ]
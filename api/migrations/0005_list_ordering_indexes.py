@@ -0,0 +1,49 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_contact_created_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='certification',
+            index=models.Index(fields=['-created_at', '-id'], name='certification_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['email', '-created_at', '-id'], name='contact_email_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactinfo',
+            index=models.Index(fields=['-created_at', '-id'], name='contactinfo_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='education',
+            index=models.Index(fields=['-created_at', '-id'], name='education_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(fields=['-created_at', '-id'], name='experience_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(fields=['-created_at', '-id'], name='profile_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-created_at', '-id'], name='project_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['-created_at', '-id'], name='skill_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['category', '-created_at', '-id'], name='skill_category_created_idx'),
+        ),
+    ]
@@ -1,3 +1,5 @@
+import uuid
+
 from django.db import models
 
 class Profile(models.Model):
@@ -6,6 +8,8 @@ class Profile(models.Model):
     bio = models.TextField()
     # Added blank=True, null=True to allow creating profile without uploading image immediately
     profile_picture = models.URLField(blank=True, null=True) 
+    # Resized copies of profile_picture: {format: {width: url}}, see api/util/image_variants.py
+    profile_picture_variants = models.JSONField(default=dict, blank=True)
     resume = models.URLField(blank=True, null=True)
     email = models.EmailField()
     phone = models.CharField(max_length=20)
@@ -17,6 +21,11 @@ class Profile(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     modified_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='profile_created_id_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -33,6 +42,13 @@ class Skill(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     modified_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='skill_created_id_idx'),
+            # ?category= filtered lists, in keyset order.
+            models.Index(fields=['category', '-created_at', '-id'], name='skill_category_created_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -40,18 +56,25 @@ class Experience(models.Model):
     company_name = models.CharField(max_length=100)
     role = models.CharField(max_length=100)
     logo = models.URLField(blank=True, null=True)
+    logo_variants = models.JSONField(default=dict, blank=True)
     start_date = models.DateField(null=True, blank=True)
     end_date = models.DateField(null=True, blank=True)
     description = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     modified_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='experience_created_id_idx'),
+        ]
+
     def __str__(self):
         return f"{self.role} at {self.company_name}"
 
 class Project(models.Model):
     title = models.CharField(max_length=100)
     image = models.URLField(blank=True, null=True)
+    image_variants = models.JSONField(default=dict, blank=True)
     description = models.TextField()
     tech_stack = models.CharField(max_length=200, blank=True, null=True)
     github_link = models.URLField(blank=True)
@@ -59,16 +82,27 @@ class Project(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     modified_at = models.DateTimeField(auto_now=True)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='project_created_id_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
 class Certification(models.Model):
     title = models.CharField(max_length=100)
     image = models.URLField(blank=True, null=True)
+    image_variants = models.JSONField(default=dict, blank=True)
     pdf_file = models.URLField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     modified_at = models.DateTimeField(auto_now=True)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='certification_created_id_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -81,6 +115,11 @@ class Education(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     modified_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='education_created_id_idx'),
+        ]
+
     def __str__(self):
         return f"{self.degree} - {self.institution}"
     
@@ -92,6 +131,14 @@ class Contact(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     modified_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Backs the keyset pagination of the admin inbox.
+            models.Index(fields=['-created_at', '-id'], name='contact_created_id_idx'),
+            # ?email= filtered inbox, in keyset order.
+            models.Index(fields=['email', '-created_at', '-id'], name='contact_email_created_idx'),
+        ]
+
     def __str__(self):
         return f"Message from {self.name}"
 
@@ -108,5 +155,57 @@ class ContactInfo(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     modified_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='contactinfo_created_id_idx'),
+        ]
+
+    def __str__(self):
+        return "Contact Information"
+
+class UploadJob(models.Model):
+    """
+    Background upload of the files sent with a write request. The request
+    spools the files to local disk and returns straight away; a worker uploads
+    them and patches the URL fields of the target object.
+    """
+    STATUS_CHOICES = [
+        ('PENDING', 'Pending'),
+        ('RUNNING', 'Running'),
+        ('SUCCEEDED', 'Succeeded'),
+        ('FAILED', 'Failed'),
+    ]
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    status = models.CharField(max_length=9, choices=STATUS_CHOICES, default='PENDING')
+    model_label = models.CharField(max_length=100)
+    object_id = models.BigIntegerField()
+    # field name -> {"path": spooled file, "folder": storage folder, "sha256": content hash}
+    files = models.JSONField(default=dict)
+    # field name -> uploaded URL
+    result = models.JSONField(default=dict, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    modified_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Upload job {self.id} ({self.status})"
+
+
+class MediaAsset(models.Model):
+    """
+    A stored media file, keyed by the SHA-256 of its content. Uploading the
+    same bytes again reuses secure_url instead of storing a second copy.
+    """
+    sha256 = models.CharField(max_length=64, unique=True)
+    secure_url = models.URLField(max_length=500)
+    public_id = models.CharField(max_length=255)
+    resource_type = models.CharField(max_length=20, default='image')
+    size = models.PositiveBigIntegerField(default=0)
+    # How often an upload was served from this asset, and the bytes it did not send
+    reuse_count = models.PositiveIntegerField(default=0)
+    bytes_saved = models.PositiveBigIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    modified_at = models.DateTimeField(auto_now=True)
+
     def __str__(self):
-        return "Contact Information"
\ No newline at end of file
+        return f"{self.public_id} ({self.sha256[:12]})"
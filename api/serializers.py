@@ -20,6 +20,8 @@ class ProfileSerializer(serializers.ModelSerializer):
     class Meta:
         model = Profile
         fields = '__all__'
+        # Filled in by the upload job
+        read_only_fields = ['profile_picture_variants']
 
 class SkillSerializer(serializers.ModelSerializer):
     class Meta:
@@ -30,16 +32,22 @@ class ExperienceSerializer(serializers.ModelSerializer):
     class Meta:
         model = Experience
         fields = '__all__'
+        # Filled in by the upload job
+        read_only_fields = ['logo_variants']
 
 class ProjectSerializer(serializers.ModelSerializer):
     class Meta:
         model = Project
         fields = '__all__'
+        # Filled in by the upload job
+        read_only_fields = ['image_variants']
 
 class CertificationSerializer(serializers.ModelSerializer):
     class Meta:
         model = Certification
         fields = '__all__'
+        # Filled in by the upload job
+        read_only_fields = ['image_variants']
 
 class EducationSerializer(serializers.ModelSerializer):
     class Meta:
@@ -54,4 +62,10 @@ class ContactSerializer(serializers.ModelSerializer):
 class ContactInfoSerializer(serializers.ModelSerializer):
     class Meta:
         model = ContactInfo
-        fields = '__all__'
\ No newline at end of file
+        fields = '__all__'
+
+class UploadJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = UploadJob
+        # `files` holds local spool paths and is not exposed
+        fields = ['id', 'status', 'model_label', 'object_id', 'result', 'error', 'created_at', 'modified_at']
@@ -0,0 +1,69 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from .models import (
+    Profile, Skill, Experience, Project, Certification, Education, Contact,
+    ContactInfo
+)
+from .util.cache_util import payload_cache
+from .util.replicas import note_model_changed
+from .util.token_blacklist import blacklist_index
+from .util.token_cache import token_cache
+
+# Models with versioned entries in the payload cache (list payloads and
+# conditional GET validators).
+CACHED_MODELS = (
+    Profile, Skill, Experience, Project, Certification, Education, Contact,
+    ContactInfo
+)
+
+
+def invalidate_payload_cache(sender, **kwargs):
+    # Bump after commit so a concurrent reader can never cache uncommitted
+    # (or rolled back) rows under the new version.
+    transaction.on_commit(lambda: payload_cache.bump_version(sender))
+
+
+for model in CACHED_MODELS:
+    post_save.connect(
+        invalidate_payload_cache, sender=model,
+        dispatch_uid=f'payload_cache_save_{model._meta.model_name}'
+    )
+    post_delete.connect(
+        invalidate_payload_cache, sender=model,
+        dispatch_uid=f'payload_cache_delete_{model._meta.model_name}'
+    )
+
+
+def keep_reads_on_primary(sender, **kwargs):
+    # Reads of a model that was just written go to the primary for a while,
+    # see api/util/replicas.py.
+    transaction.on_commit(lambda: note_model_changed(sender))
+
+
+# Every model, including auth and token blacklist tables.
+post_save.connect(keep_reads_on_primary, dispatch_uid='replica_lag_guard_save')
+post_delete.connect(keep_reads_on_primary, dispatch_uid='replica_lag_guard_delete')
+
+
+def evict_user_tokens(sender, instance, **kwargs):
+    # Cached tokens carry a snapshot of their user; drop them once the user
+    # is changed (password, is_active, ...) or deleted.
+    # Read the pk now: delete() has cleared it by the time of the commit.
+    user_id = instance.pk
+    transaction.on_commit(lambda: token_cache.evict(user_id=user_id))
+
+
+post_save.connect(evict_user_tokens, sender=get_user_model(), dispatch_uid='token_cache_user_save')
+post_delete.connect(evict_user_tokens, sender=get_user_model(), dispatch_uid='token_cache_user_delete')
+
+
+def reload_blacklist_index(sender, **kwargs):
+    # An un-blacklisted (or pruned) token has to leave the index; deletions
+    # are rare, so simply reload it.
+    transaction.on_commit(blacklist_index.invalidate)
+
+
+post_delete.connect(reload_blacklist_index, sender=BlacklistedToken, dispatch_uid='blacklist_index_delete')
@@ -1,3 +1,630 @@
-from django.test import TestCase
+import os
+import shutil
+import tempfile
+from datetime import date
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import AsyncRequestFactory, Client, RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from api.authentication import SafeJWTAuthentication
+from api.models import (
+    Certification, Contact, ContactInfo, Education, Experience, MediaAsset, Profile, Project, Skill,
+    UploadJob,
+)
+from api.serializers import (
+    CertificationSerializer, ContactInfoSerializer, ContactSerializer, EducationSerializer,
+    ExperienceSerializer, ProfileSerializer, ProjectSerializer, SkillSerializer, UploadJobSerializer,
+)
+from api.util.base_serializer import get_response_serializer, get_values_serializer, serialize_list
+from api.util.cache_util import payload_cache
+from api.util.pagination import KeysetPaginator, encode_cursor
+from api.util.query_params import DEFAULT_ORDERING, ListQuery
+from api.util.renderers import FastJSONRenderer
+from api.util import throttling
+from api.util.async_reads import hybrid_view
+from api.util.replicas import ReplicaRouter, ReplicaRoutingMiddleware, note_model_changed
+from api.util.storage import BatchUploadError, get_storage, upload_files
+from api.util.token_blacklist import BlacklistIndex, IndexedRefreshToken
+from api.util.token_cache import token_cache
+from api.util.upload_jobs import run_upload_job
+from api.views import ContactView, PortfolioView, SkillView
+
+# How each backend's EXPLAIN shows a sort that no index could provide.
+SORT_MARKERS = {
+    'sqlite': 'USE TEMP B-TREE FOR ORDER BY',
+    'postgresql': 'Sort',
+}
+
+
+class ListQueryPlanTests(TestCase):
+    """List queries (plain and filtered) are read in index order, without a sort step."""
+
+    def setUp(self):
+        if connection.vendor not in SORT_MARKERS:
+            self.skipTest(f"No plan expectations for {connection.vendor}")
+        if connection.vendor == 'postgresql':
+            # Test tables are tiny; make the planner show which index it would use.
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+
+    def get_plan(self, view_class, model, **params):
+        request = RequestFactory().get('/', params)
+        query = ListQuery(request, model, view_class.filter_fields, view_class.ordering_fields)
+        return query.apply(model.objects.all()).explain()
+
+    def assertReadInIndexOrder(self, plan, index_name):
+        self.assertIn(index_name, plan)
+        self.assertNotIn(SORT_MARKERS[connection.vendor], plan)
+
+    def test_skill_list(self):
+        self.assertReadInIndexOrder(self.get_plan(SkillView, Skill), 'skill_created_id_idx')
+
+    def test_skill_list_filtered_by_category(self):
+        plan = self.get_plan(SkillView, Skill, category='WEB')
+        self.assertReadInIndexOrder(plan, 'skill_category_created_idx')
+
+    def test_contact_inbox(self):
+        self.assertReadInIndexOrder(self.get_plan(ContactView, Contact), 'contact_created_id_idx')
+
+    def test_contact_inbox_filtered_by_email(self):
+        plan = self.get_plan(ContactView, Contact, email='jane@example.com')
+        self.assertReadInIndexOrder(plan, 'contact_email_created_idx')
+
+
+class ValuesSerializerParityTests(TestCase):
+    """serialize_list() (values() rows + compiled converters) renders exactly like the DRF serializers."""
+
+    URL = 'https://res.cloudinary.com/demo/image/upload/v1/portfolio/sample.png'
+    VARIANTS = {'webp': {'320': URL, '640': URL}, 'avif': {}}
+
+    @classmethod
+    def setUpTestData(cls):
+        # Filled-in and sparse rows, with non-ASCII text and JSON-breaking characters.
+        Profile.objects.create(
+            name='Zoë Ñandú', title='Engineer', bio='Line\u2028separated "bio"', profile_picture=cls.URL,
+            profile_picture_variants=cls.VARIANTS, email='zoe@example.com', phone='+1', address='Here',
+        )
+        Profile.objects.create(name='Empty', title='', bio='', email='e@example.com', phone='', address='')
+        for i in range(3):
+            Skill.objects.create(name=f'Skill {i}', percentage=i * 45, category='WEB')
+        Experience.objects.create(
+            company_name='Acme', role='Dev', logo=cls.URL, logo_variants=cls.VARIANTS,
+            start_date=date(2020, 2, 29), end_date=None, description='Did things.',
+        )
+        Experience.objects.create(company_name='Other', role='Dev', description='')
+        Project.objects.create(
+            title='Site', description='Built it.', image=cls.URL, image_variants=cls.VARIANTS,
+            tech_stack='Django, DRF', github_link='https://github.com/example/site', live_url=None,
+        )
+        Certification.objects.create(title='Cert', image=None, pdf_file=cls.URL)
+        Education.objects.create(
+            institution='University', degree='BSc', start_date=date(2016, 9, 1),
+            end_date=date(2020, 6, 30), description='Studied.',
+        )
+        Contact.objects.create(name='Jane', email='jane@example.com', message='Hello\nthere')
+        ContactInfo.objects.create(address='Here', email='me@example.com', description='Write me', phone='+1')
+        UploadJob.objects.create(model_label='api.Project', object_id=1, result={'image': cls.URL})
+
+    def assertSameOutput(self, queryset, serializer_class):
+        self.assertIsNotNone(get_values_serializer(serializer_class))
+        renderer = JSONRenderer()
+        self.assertEqual(
+            renderer.render(serialize_list(queryset, serializer_class)),
+            renderer.render(serializer_class(queryset, many=True).data),
+        )
+
+    def test_list_serializers(self):
+        for model, serializer_class in (
+            (Profile, ProfileSerializer),
+            (Skill, SkillSerializer),
+            (Experience, ExperienceSerializer),
+            (Project, ProjectSerializer),
+            (Certification, CertificationSerializer),
+            (Education, EducationSerializer),
+            (Contact, ContactSerializer),
+            (ContactInfo, ContactInfoSerializer),
+            (UploadJob, UploadJobSerializer),
+        ):
+            with self.subTest(model=model.__name__):
+                self.assertSameOutput(model.objects.order_by(*DEFAULT_ORDERING), serializer_class)
+
+    def test_sparse_fieldset_serializer(self):
+        serializer_class = get_response_serializer(Project, fields=['title', 'image_variants', 'created_at'])
+        self.assertSameOutput(Project.objects.only('title', 'image_variants', 'created_at'), serializer_class)
+
+    def test_keyset_page(self):
+        request = Request(RequestFactory().get('/', {'page_size': 2}))
+        queryset = Skill.objects.all()
+        paginator = KeysetPaginator(request)
+        page = paginator.get_page_data(queryset, SkillSerializer)
+        rows, _ = paginator.paginate_queryset(queryset)
+        self.assertEqual(
+            JSONRenderer().render(page['results']),
+            JSONRenderer().render(SkillSerializer(rows, many=True).data),
+        )
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    """FastJSONRenderer renders what JSONRenderer does, and falls back to it where orjson can't."""
+
+    def assertSameAsJSONRenderer(self, data, renderer_class=FastJSONRenderer, accepted_media_type=None):
+        stock_class = type('StockRenderer', (JSONRenderer,), {
+            attr: getattr(renderer_class, attr) for attr in ('compact', 'ensure_ascii', 'strict')
+        })
+        self.assertEqual(
+            renderer_class().render(data, accepted_media_type),
+            stock_class().render(data, accepted_media_type),
+        )
+
+    def test_payload(self):
+        data = {'name': 'Zoë ', 'count': 3, 'items': [None, True, {'a': []}]}
+        self.assertSameAsJSONRenderer(data)
+        self.assertSameAsJSONRenderer(data, accepted_media_type='application/json; indent=2')
+        self.assertSameAsJSONRenderer(data, accepted_media_type='application/json; indent=4')
+
+    def test_integer_beyond_64_bits(self):
+        self.assertSameAsJSONRenderer({'big': 2 ** 70})
+
+    def test_rest_framework_json_settings(self):
+        data = {'name': 'Zoë', 'items': [1, 2]}
+        for attr, value in (('compact', False), ('ensure_ascii', True)):
+            with self.subTest(attr=attr):
+                renderer_class = type('Renderer', (FastJSONRenderer,), {attr: value})
+                self.assertSameAsJSONRenderer(data, renderer_class)
+
+
+class ResponseCacheTests(TestCase):
+    """Only a bounded set of variants is cached, whatever the client sends."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.skill = Skill.objects.create(name='Python', percentage=90, category='WEB')
+
+    def setUp(self):
+        payload_cache.clear()
+
+    def assertNoNewEntries(self, path, params=None, **headers):
+        entries = payload_cache.stats()['entries']
+        response = self.client.get(path, params, headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(payload_cache.stats()['entries'], entries)
+
+    def test_default_list_is_cached(self):
+        self.client.get('/api/skills/')
+        entries = payload_cache.stats()['entries']
+        self.assertGreater(entries, 0)
+        self.assertNoNewEntries('/api/skills/', {'ordering': '-created_at'})
+        self.assertNoNewEntries('/api/skills/', Accept='application/json; x=1')
+
+    def test_junk_variants_are_not_cached(self):
+        self.client.get('/api/skills/')
+        self.client.get('/api/portfolio/')
+        cursor = encode_cursor(self.skill.created_at, self.skill.pk + 1)
+        for params in (
+            {'category': 'random'},
+            {'page_size': '01'},
+            {'page_size': '001'},
+            {'cursor': cursor},
+            {'fields': 'name'},
+            {'ordering': 'name,name'},
+            {'unknown': '1'},
+        ):
+            with self.subTest(params=params):
+                self.assertNoNewEntries('/api/skills/', params)
+        self.assertNoNewEntries('/api/portfolio/', {'sections': 'skills,profiles'})
+        self.assertNoNewEntries('/api/portfolio/', {'sections': 'profiles,profiles'})
+
+
+class UploadTooLargeTests(TestCase):
+    """Oversized multipart bodies get the envelope 413 on any view, and leave no spooled files."""
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user('admin', 'admin@example.com', 'password')
+        cls.token = str(RefreshToken.for_user(user).access_token)
+
+    def setUp(self):
+        self.spool_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.spool_dir)
+        overrides = override_settings(
+            UPLOAD_STREAMING={**settings.UPLOAD_STREAMING, 'CHUNK_SIZE': 1024, 'MAX_FILE_SIZE': 4096},
+            UPLOAD_JOBS={**settings.UPLOAD_JOBS, 'SPOOL_DIR': self.spool_dir},
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+
+    def post(self, path, data):
+        return self.client.post(path, data, headers={'Authorization': f'Bearer {self.token}'})
+
+    def assertTooLarge(self, response):
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(response.json(), {
+            'success': False,
+            'return_code': 'UPLOAD_TOO_LARGE',
+            'message': 'Uploaded file is too large.',
+        })
+
+    def test_upload_view(self):
+        self.assertTooLarge(self.post('/api/certifications/', {
+            'title': 'Cert',
+            'pdf_file': SimpleUploadedFile('small.pdf', b'x' * 100),
+            'image': SimpleUploadedFile('large.png', b'x' * 10000),
+        }))
+        self.assertEqual(os.listdir(self.spool_dir), [])
+
+    def test_view_without_uploads(self):
+        self.assertTooLarge(self.post('/api/skills/', {
+            'name': 'Python',
+            'attachment': SimpleUploadedFile('large.bin', b'x' * 10000),
+        }))
+        self.assertEqual(os.listdir(self.spool_dir), [])
+
+
+class BlacklistIndexTests(TestCase):
+    """The blacklist index answers like the database, right from the first lookup."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('admin', 'admin@example.com', 'password')
+
+    def test_first_lookup_loads_the_index(self):
+        token = RefreshToken.for_user(self.user)
+        token.blacklist()
+        # On a host booted less than BLACKLIST_REFRESH_SECONDS ago.
+        with mock.patch('api.util.token_blacklist.time.monotonic', return_value=1.0):
+            self.assertTrue(BlacklistIndex().contains(token['jti']))
+
+    def test_blacklisted_refresh_token_is_rejected(self):
+        token = IndexedRefreshToken.for_user(self.user)
+        IndexedRefreshToken(str(token))
+        token.blacklist()
+        with self.assertRaises(TokenError):
+            IndexedRefreshToken(str(token))
+
+
+class TokenCacheEvictionTests(TestCase):
+    """Cached access tokens are dropped on logout and when their user changes."""
+
+    def setUp(self):
+        token_cache.clear()
+        self.user = User.objects.create_user('admin', 'admin@example.com', 'password')
+        self.refresh = RefreshToken.for_user(self.user)
+        self.access = str(self.refresh.access_token)
+        self.authenticate()
+
+    def authenticate(self):
+        request = RequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {self.access}')
+        SafeJWTAuthentication().authenticate(request)
+        self.assertIsNotNone(token_cache.get(self.access.encode()))
+
+    def test_user_saved(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+        self.assertIsNone(token_cache.get(self.access.encode()))
+
+    def test_user_deleted(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.delete()
+        self.assertIsNone(token_cache.get(self.access.encode()))
+
+    def test_logout(self):
+        response = self.client.post(
+            '/api/logout/', {'refresh': str(self.refresh)}, content_type='application/json',
+            headers={'Authorization': f'Bearer {self.access}'},
+        )
+        self.assertEqual(response.status_code, 205)
+        self.assertIsNone(token_cache.get(self.access.encode()))
+
+
+class LocalMediaTestCase(TestCase):
+    """Stores media with LocalMediaStorage, and spools uploads, in temporary directories."""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.spool_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        self.addCleanup(shutil.rmtree, self.spool_dir)
+        overrides = override_settings(
+            MEDIA_STORAGE_BACKEND='api.util.storage.LocalMediaStorage',
+            MEDIA_ROOT=self.media_root,
+            UPLOAD_JOBS={**settings.UPLOAD_JOBS, 'ASYNC': True, 'SPOOL_DIR': self.spool_dir},
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        get_storage.cache_clear()
+        self.addCleanup(get_storage.cache_clear)
+
+
+class UploadDedupTests(LocalMediaTestCase):
+    """upload_files() stores each content once and counts the reuses of a successful batch."""
+
+    def upload(self, **contents):
+        return upload_files({
+            key: (SimpleUploadedFile(f'{key}.png', content), 'test')
+            for key, content in contents.items()
+        })
+
+    def test_identical_content_is_reused(self):
+        first = self.upload(image=b'same')['image']
+        with mock.patch.object(get_storage(), 'upload') as upload:
+            second = self.upload(image=b'same')['image']
+        upload.assert_not_called()
+        self.assertTrue(second['reused'])
+        self.assertEqual(second['secure_url'], first['secure_url'])
+        asset = MediaAsset.objects.get()
+        self.assertEqual((asset.reuse_count, asset.bytes_saved), (1, len(b'same')))
+
+    def test_new_content_is_uploaded(self):
+        first = self.upload(image=b'one')['image']
+        second = self.upload(image=b'two')['image']
+        self.assertNotIn('reused', second)
+        self.assertNotEqual(second['public_id'], first['public_id'])
+        self.assertEqual(MediaAsset.objects.count(), 2)
+        self.assertEqual(MediaAsset.objects.filter(reuse_count=0).count(), 2)
+
+    def test_missing_stored_file_is_uploaded_again(self):
+        first = self.upload(image=b'gone')['image']
+        os.remove(os.path.join(self.media_root, first['public_id']))
+
+        second = self.upload(image=b'gone')['image']
+        self.assertNotIn('reused', second)
+        self.assertTrue(os.path.exists(os.path.join(self.media_root, second['public_id'])))
+        asset = MediaAsset.objects.get()
+        self.assertEqual(asset.public_id, second['public_id'])
+        self.assertEqual(asset.reuse_count, 0)
+
+    def test_failed_batch_counts_no_reuse(self):
+        stored = self.upload(image=b'kept')['image']
+        storage = get_storage()
+        with mock.patch.object(storage, 'upload', side_effect=RuntimeError('boom')):
+            with self.assertRaises(BatchUploadError) as raised:
+                self.upload(image=b'kept', other=b'new')
+        self.assertEqual(list(raised.exception.errors), ['other'])
+
+        asset = MediaAsset.objects.get()
+        self.assertEqual((asset.reuse_count, asset.bytes_saved), (0, 0))
+        # The reused file is shared, so the rollback leaves it alone.
+        self.assertTrue(os.path.exists(os.path.join(self.media_root, stored['public_id'])))
+
+
+@mock.patch('api.util.upload_jobs.close_old_connections', lambda: None)
+class UploadJobTests(LocalMediaTestCase):
+    """Write requests with files answer 202 and leave the upload to a job."""
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user('admin', 'admin@example.com', 'password')
+        cls.token = str(RefreshToken.for_user(user).access_token)
+
+    def put_pdf(self, certification, content, client=None):
+        """PUT a new pdf_file; returns the response and the upload job it scheduled."""
+        client = client or self.client
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = client.put(
+                f'/api/certifications/{certification.pk}/',
+                encode_multipart(BOUNDARY, {'pdf_file': SimpleUploadedFile('cert.pdf', content)}),
+                content_type=MULTIPART_CONTENT,
+                headers={'Authorization': f'Bearer {self.token}'},
+            )
+        return response, callbacks
+
+    def test_job_uploads_the_file(self):
+        certification = Certification.objects.create(title='Cert')
+        response, callbacks = self.put_pdf(certification, b'%PDF-1')
+        self.assertEqual(response.status_code, 202)
+        job = response.json()['data']['upload_job']
+        self.assertEqual(job['status'], 'PENDING')
+        self.assertTrue(callbacks)
+
+        run_upload_job(job['id'])
+        job = UploadJob.objects.get(pk=job['id'])
+        certification.refresh_from_db()
+        self.assertEqual(job.status, 'SUCCEEDED')
+        self.assertEqual(certification.pdf_file, job.result['pdf_file'])
+        self.assertTrue(certification.pdf_file.startswith(settings.MEDIA_PUBLIC_BASE_URL))
+        self.assertEqual(os.listdir(self.spool_dir), [])
+
+    def test_failed_request_discards_spooled_files(self):
+        certification = Certification.objects.create(title='Cert')
+        client = Client(raise_request_exception=False)
+        with mock.patch('api.views.schedule_upload_job', side_effect=RuntimeError('boom')):
+            response, callbacks = self.put_pdf(certification, b'%PDF-1', client)
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(callbacks, [])
+        self.assertEqual(os.listdir(self.spool_dir), [])
+
+    def test_older_job_finishing_last_does_not_overwrite(self):
+        certification = Certification.objects.create(title='Cert')
+        older = self.put_pdf(certification, b'%PDF-old')[0].json()['data']['upload_job']['id']
+        newer = self.put_pdf(certification, b'%PDF-new')[0].json()['data']['upload_job']['id']
+
+        run_upload_job(newer)
+        run_upload_job(older)
+        certification.refresh_from_db()
+        self.assertEqual(certification.pdf_file, UploadJob.objects.get(pk=newer).result['pdf_file'])
+        self.assertEqual(UploadJob.objects.get(pk=older).status, 'SUCCEEDED')
+
+
+@override_settings(DATABASE_REPLICAS={
+    'ALIASES': ['replica_0'], 'PATH_PREFIX': '/api/', 'STICKY_SECONDS': 5, 'LAG_SECONDS': 5,
+})
+class ReplicaRouterTests(SimpleTestCase):
+    """Where ReplicaRouter sends reads within requests routed by ReplicaRoutingMiddleware."""
+
+    def setUp(self):
+        caches['default'].clear()
+        self.addCleanup(caches['default'].clear)
+        self.factory = RequestFactory()
+
+    def route(self, method, model=Skill, status=200, token='admin'):
+        """The database a read of model goes to while the middleware handles the request."""
+        reads = []
+
+        def get_response(request):
+            reads.append(ReplicaRouter().db_for_read(model))
+            return mock.Mock(status_code=status)
+
+        request = getattr(self.factory, method)('/api/skills/', headers={'Authorization': f'Bearer {token}'})
+        ReplicaRoutingMiddleware(get_response)(request)
+        return reads[0]
+
+    def test_safe_request_reads_from_replica(self):
+        self.assertEqual(self.route('get'), 'replica_0')
+
+    def test_write_request_reads_from_primary(self):
+        self.assertEqual(self.route('post', status=201), 'default')
+
+    def test_client_reads_from_primary_after_its_write(self):
+        self.route('post', status=201)
+        self.assertEqual(self.route('get'), 'default')
+        self.assertEqual(self.route('get', token='visitor'), 'replica_0')
+
+    def test_failed_write_is_not_sticky(self):
+        self.route('post', status=400)
+        self.assertEqual(self.route('get'), 'replica_0')
+
+    def test_changed_model_reads_from_primary(self):
+        note_model_changed(Skill)
+        self.assertEqual(self.route('get', token='visitor'), 'default')
+        self.assertEqual(self.route('get', model=Project, token='visitor'), 'replica_0')
+
+    def test_outside_a_request_reads_from_primary(self):
+        self.assertEqual(ReplicaRouter().db_for_read(Skill), 'default')
+
+
+@override_settings(API_RATE_LIMIT={
+    'ENABLED': True, 'LOCAL_MAX_ENTRIES': 100, 'SHARED_CACHE_ALIAS': None,
+    'CONTACT': {'BURST': 2, 'PER_HOUR': 1},
+})
+class ContactThrottleTests(TestCase):
+    """ContactView.post is limited per client IP and per submitted email."""
+
+    def setUp(self):
+        throttling.local_stores.clear()
+        self.addCleanup(throttling.local_stores.clear)
+
+    def submit(self, email='visitor@example.com', ip='10.0.0.1'):
+        return self.client.post(
+            '/api/contacts/',
+            {'name': 'Visitor', 'email': email, 'message': 'Hello'},
+            content_type='application/json',
+            REMOTE_ADDR=ip,
+        )
+
+    def assertThrottled(self, response):
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.json(), {
+            'success': False,
+            'return_code': 'RATE_LIMITED',
+            'message': 'Too many requests. Please try again later.',
+        })
+        # One token regained per hour
+        self.assertEqual(response['Retry-After'], '3600')
+
+    def test_ip_over_burst_is_throttled(self):
+        self.assertEqual(self.submit(email='a@example.com').status_code, 201)
+        self.assertEqual(self.submit(email='b@example.com').status_code, 201)
+        self.assertThrottled(self.submit(email='c@example.com'))
+        self.assertEqual(self.submit(email='c@example.com', ip='10.0.0.2').status_code, 201)
+        self.assertEqual(Contact.objects.count(), 3)
+
+    def test_email_over_burst_is_throttled_across_ips(self):
+        self.assertEqual(self.submit(ip='10.0.0.1').status_code, 201)
+        self.assertEqual(self.submit(ip='10.0.0.2', email=' Visitor@Example.com').status_code, 201)
+        self.assertThrottled(self.submit(ip='10.0.0.3'))
+        self.assertEqual(self.submit(ip='10.0.0.3', email='other@example.com').status_code, 201)
+
+    def test_ip_over_burst_is_rejected_before_parsing(self):
+        self.submit()
+        self.submit()
+        response = self.client.post('/api/contacts/', '{', content_type='application/json', REMOTE_ADDR='10.0.0.1')
+        self.assertThrottled(response)
+
+
+class ValidationErrorResponseTests(TestCase):
+    """Write views answer invalid data with get_validation_error_response()."""
+
+    def test_contact_form(self):
+        response = self.client.post(
+            '/api/contacts/', {'name': 'Visitor', 'email': 'not-an-email', 'message': 'Hello'},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {
+            'success': False,
+            'return_code': 'VALIDATION_ERROR',
+            'message': 'Enter a valid email address.',
+            'errors': {'email': ['Enter a valid email address.']},
+            'error_detail': 'Enter a valid email address.',
+        })
+
+
+def sync_view_not_used(sync_view):
+    async def view(request, *args, **kwargs):
+        raise AssertionError(f'{request.get_full_path()} was left to the sync view')
+    return view
+
+
+class AsyncReadTests(TestCase):
+    """hybrid_view answers public JSON GETs itself, with exactly the sync view's response."""
+
+    URL = 'https://res.cloudinary.com/demo/image/upload/v1/portfolio/sample.png'
+
+    @classmethod
+    def setUpTestData(cls):
+        Profile.objects.create(name='Zoë', title='Engineer', bio='Bio', profile_picture=cls.URL, email='z@example.com')
+        for i in range(3):
+            cls.skill = Skill.objects.create(name=f'Skill {i}', percentage=i * 45, category='WEB')
+        Project.objects.create(title='Site', description='Built it.', image=cls.URL, tech_stack='Django')
+
+    def setUp(self):
+        payload_cache.clear()
+        self.addCleanup(payload_cache.clear)
+
+    def get_async(self, view_class, path, pk=None, **headers):
+        with mock.patch('api.util.async_reads.sync_to_async', sync_view_not_used):
+            view = hybrid_view(view_class)
+        request = AsyncRequestFactory().get(path, headers=headers)
+        return async_to_sync(view)(request, **({} if pk is None else {'pk': pk}))
+
+    def assertSameAsSync(self, view_class, path, pk=None, **headers):
+        async_response = self.get_async(view_class, path, pk, **headers)
+        # Nothing the async path cached may answer the sync request.
+        payload_cache.clear()
+        sync_response = self.client.get(path, headers=headers)
+
+        self.assertEqual(async_response.status_code, 200)
+        self.assertEqual(async_response.status_code, sync_response.status_code)
+        self.assertEqual(async_response.content, sync_response.content)
+        for header in ('Content-Type', 'ETag', 'Last-Modified', 'Cache-Control'):
+            self.assertEqual(async_response.get(header), sync_response.get(header), header)
+
+    def test_list_and_detail(self):
+        self.assertSameAsSync(SkillView, '/api/skills/')
+        self.assertSameAsSync(SkillView, '/api/skills/?category=WEB&ordering=name')
+        self.assertSameAsSync(SkillView, f'/api/skills/{self.skill.pk}/', pk=self.skill.pk)
+
+    def test_accept_headers_negotiating_json(self):
+        for accept in ('application/json, text/plain, */*', '*/*', 'application/json; indent=4'):
+            with self.subTest(accept=accept):
+                self.assertSameAsSync(SkillView, '/api/skills/', Accept=accept)
+
+    def test_portfolio(self):
+        self.assertSameAsSync(PortfolioView, '/api/portfolio/')
+        self.assertSameAsSync(PortfolioView, '/api/portfolio/?sections=skills,profiles')
+
+    def test_browsable_api_is_left_to_the_sync_view(self):
+        with self.assertRaisesMessage(AssertionError, 'was left to the sync view'):
+            self.get_async(SkillView, '/api/skills/', Accept='text/html')
@@ -1,5 +1,15 @@
+from django.conf import settings
 from django.urls import path
 from .views import *
+from .util.async_reads import hybrid_view
+
+
+def resource_view(view_class):
+    # Under an ASGI server (API_ASYNC_VIEWS=True) public GETs are served natively async.
+    if settings.API_ASYNC_VIEWS:
+        return hybrid_view(view_class)
+    return view_class.as_view()
+
 
 urlpatterns = [
     # Authentication
@@ -7,34 +17,43 @@ urlpatterns = [
     path('logout/', LogoutView.as_view(), name='logout'),
     
     # Profile endpoints
-    path('profiles/', ProfileView.as_view(), name='profile-list-create'),
-    path('profiles/<int:pk>/', ProfileView.as_view(), name='profile-detail'),
+    path('profiles/', resource_view(ProfileView), name='profile-list-create'),
+    path('profiles/<int:pk>/', resource_view(ProfileView), name='profile-detail'),
     
     # Skill endpoints
-    path('skills/', SkillView.as_view(), name='skill-list-create'),
-    path('skills/<int:pk>/', SkillView.as_view(), name='skill-detail'),
+    path('skills/', resource_view(SkillView), name='skill-list-create'),
+    path('skills/<int:pk>/', resource_view(SkillView), name='skill-detail'),
     
     # Experience endpoints
-    path('experiences/', ExperienceView.as_view(), name='experience-list-create'),
-    path('experiences/<int:pk>/', ExperienceView.as_view(), name='experience-detail'),
+    path('experiences/', resource_view(ExperienceView), name='experience-list-create'),
+    path('experiences/<int:pk>/', resource_view(ExperienceView), name='experience-detail'),
     
     # Project endpoints
-    path('projects/', ProjectView.as_view(), name='project-list-create'),
-    path('projects/<int:pk>/', ProjectView.as_view(), name='project-detail'),
+    path('projects/', resource_view(ProjectView), name='project-list-create'),
+    path('projects/<int:pk>/', resource_view(ProjectView), name='project-detail'),
     
     # Certification endpoints
-    path('certifications/', CertificationView.as_view(), name='certification-list-create'),
-    path('certifications/<int:pk>/', CertificationView.as_view(), name='certification-detail'),
+    path('certifications/', resource_view(CertificationView), name='certification-list-create'),
+    path('certifications/<int:pk>/', resource_view(CertificationView), name='certification-detail'),
     
     # Education endpoints
-    path('education/', EducationView.as_view(), name='education-list-create'),
-    path('education/<int:pk>/', EducationView.as_view(), name='education-detail'),
+    path('education/', resource_view(EducationView), name='education-list-create'),
+    path('education/<int:pk>/', resource_view(EducationView), name='education-detail'),
     
     # Contact endpoints
     path('contacts/', ContactView.as_view(), name='contact-list-create'),
     path('contacts/<int:pk>/', ContactView.as_view(), name='contact-detail'),
 
     # ContactInfo endpoints
-    path('contactinfo/', ContactInfoView.as_view(), name='contactinfo-list-create'),
-    path('contactinfo/<int:pk>/', ContactInfoView.as_view(), name='contactinfo-detail'),
+    path('contactinfo/', resource_view(ContactInfoView), name='contactinfo-list-create'),
+    path('contactinfo/<int:pk>/', resource_view(ContactInfoView), name='contactinfo-detail'),
+
+    # Portfolio snapshot (all public sections in one request)
+    path('portfolio/', resource_view(PortfolioView), name='portfolio'),
+
+    # Background upload status
+    path('upload-jobs/<uuid:pk>/', UploadJobView.as_view(), name='upload-job-detail'),
+
+    # Runtime metrics (admin only)
+    path('metrics/', MetricsView.as_view(), name='metrics'),
 ]
\ No newline at end of file
@@ -0,0 +1,165 @@
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from rest_framework.exceptions import NotAcceptable
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from api.authentication import PUBLIC_READ_PERMISSIONS
+from api.util.base_serializer import get_values_serializer
+from api.util.cache_util import payload_cache
+from api.util.conditional import add_validator_headers, aget_validators
+from api.util.query_params import DEFAULT_ORDERING, InvalidQueryParam, ListQuery
+from api.util.response_cache import aget_response_variant
+from api.util.responses import APIResponse
+
+
+def is_async_readable(view_class):
+    """
+    Views with a single `model`, or with their own async hooks (see
+    PortfolioView: response_models, aget_validators() and abuild_data()),
+    whose reads are public.
+    """
+    return (
+        (getattr(view_class, 'model', None) is not None or hasattr(view_class, 'abuild_data'))
+        and all(permission in PUBLIC_READ_PERMISSIONS for permission in view_class.permission_classes)
+    )
+
+
+def get_response_models(view_class):
+    """The models a GET depends on; cached responses are stored under the first."""
+    return getattr(view_class, 'response_models', None) or (view_class.model,)
+
+
+def negotiate_json(request, negotiator, renderers):
+    """
+    The (renderer, accepted media type) DRF's content negotiation picks for
+    request, if that is a JSON renderer; else None, and the sync view answers
+    (the browsable API, ?format=, a 406).
+    """
+    if 'format' in request.GET:
+        return None
+    try:
+        renderer, media_type = negotiator.select_renderer(Request(request), renderers)
+    except NotAcceptable:
+        return None
+    if not isinstance(renderer, JSONRenderer):
+        return None
+    return renderer, media_type
+
+
+async def aserialize_list(queryset, serializer_class):
+    """serialize_list() over the async ORM."""
+    values_serializer = get_values_serializer(serializer_class)
+    if values_serializer is None:
+        rows = [instance async for instance in queryset.aiterator()]
+        return serializer_class(rows, many=True).data
+    return [
+        values_serializer.to_representation(row)
+        async for row in values_serializer.get_queryset(queryset).aiterator()
+    ]
+
+
+async def aget_list_data(model, serializer_class):
+    """get_list_data(model, serializer_class) without a request, sharing its cache entries."""
+    version = await payload_cache.aget_version(model)
+    data = await payload_cache.aget(model, 'list', version)
+    if data is None:
+        data = await aserialize_list(model.objects.all().order_by(*DEFAULT_ORDERING), serializer_class)
+        await payload_cache.aset(model, 'list', data, version)
+    return data
+
+
+async def abuild_model_data(view_class, request, pk):
+    """The response data of a GET, or None if the sync view should answer it."""
+    model = view_class.model
+    if pk is not None:
+        instance = await model.objects.filter(pk=pk).afirst()
+        if instance is None:
+            return None
+        return view_class.serializer_class(instance).data
+
+    # Keyset pages are left to the sync view.
+    if 'cursor' in request.GET or 'page_size' in request.GET:
+        return None
+    try:
+        query = ListQuery(request, model, view_class.filter_fields, view_class.ordering_fields)
+    except InvalidQueryParam:
+        return None
+    return await aserialize_list(
+        query.apply(model.objects.all()), query.get_serializer_class(view_class.serializer_class)
+    )
+
+
+async def aread(view_class, request, pk=None, renderer=None, media_type=None):
+    """
+    Answer a public JSON GET without leaving the event loop, following the
+    sync view exactly: conditional GET validators, the rendered response
+    cache (the same entries as @cached_response), the APIResponse envelope
+    and the negotiated renderer. Returns None when the sync view has to
+    handle the request.
+    """
+    models = get_response_models(view_class)
+    if hasattr(view_class, 'aget_validators'):
+        etag, last_modified = await view_class.aget_validators(request)
+    else:
+        etag, last_modified = await aget_validators(models[0], pk)
+    if etag is None:
+        return None
+
+    response = get_conditional_response(
+        request, etag=etag, last_modified=int(last_modified.timestamp())
+    )
+    if response is not None:
+        return add_validator_headers(response, etag, last_modified)
+
+    kwargs = {} if pk is None else {'pk': pk}
+    indent = renderer.get_indent(media_type, {})
+    variant = await aget_response_variant(request, view_class, models, kwargs, indent)
+    version = await payload_cache.aget_version(models[0])
+    body = None if variant is None else await payload_cache.aget(models[0], variant, version)
+    if body is None:
+        if hasattr(view_class, 'abuild_data'):
+            data = await view_class.abuild_data(request)
+        else:
+            data = await abuild_model_data(view_class, request, pk)
+        if data is None:
+            return None
+        envelope = APIResponse.get_success_response(view_class.retrieved_code, data).data
+        body = renderer.render(envelope, media_type, {})
+        if variant is not None:
+            await payload_cache.aset(models[0], variant, body, version)
+
+    return add_validator_headers(
+        HttpResponse(body, content_type=renderer.media_type), etag, last_modified
+    )
+
+
+def hybrid_view(view_class):
+    """
+    An async view for view_class. Public GETs that DRF's content negotiation
+    would answer with JSON are served natively (async ORM and cache, no
+    thread hop); every other request - writes, authenticated-only reads, the
+    browsable API, pagination, errors - goes to the regular sync DRF view
+    through sync_to_async. The view keeps the sync view's attributes
+    (csrf_exempt, view_class, ...).
+    """
+    sync_view = view_class.as_view()
+    async_sync_view = sync_to_async(sync_view)
+    async_reads = is_async_readable(view_class)
+    negotiator = view_class.content_negotiation_class()
+    renderers = [renderer_class() for renderer_class in view_class.renderer_classes]
+
+    @wraps(sync_view)
+    async def view(request, *args, **kwargs):
+        if async_reads and request.method == 'GET':
+            negotiated = negotiate_json(request, negotiator, renderers)
+            if negotiated is not None:
+                response = await aread(view_class, request, kwargs.get('pk'), *negotiated)
+                if response is not None:
+                    return response
+        return await async_sync_view(request, *args, **kwargs)
+
+    return view
@@ -1,8 +1,12 @@
+import sys
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, List
 
 from django.db import models
 from django.db.models import QuerySet
 from rest_framework import serializers
+from rest_framework.settings import ISO_8601, api_settings
 
 
 def get_response_serializer(
@@ -17,24 +21,133 @@ def get_response_serializer(
             "Please only provide either of fields : fields or exclude fields"
         )
 
+    return _build_response_serializer(model, tuple(fields), tuple(exclude_fields))
+
+
+# The generated classes are memoised: building a serializer class is far more
+# expensive than instantiating one, and a given combination always yields the
+# same class.
+@lru_cache(maxsize=256)
+def _build_response_serializer(model: models.Model, fields: tuple, exclude_fields: tuple):
     class ResponseSerializer(serializers.ModelSerializer):
         class Meta:
             pass
 
     ResponseSerializer.Meta.model = model
     if fields:
-        ResponseSerializer.Meta.fields = fields
+        ResponseSerializer.Meta.fields = list(fields)
     else:
-        ResponseSerializer.Meta.exclude = exclude_fields
+        ResponseSerializer.Meta.exclude = list(exclude_fields)
 
     return ResponseSerializer
 
 
+def _identity(value):
+    return value
+
+
+def _date_to_iso(value):
+    return value if isinstance(value, str) else value.isoformat()
+
+
+def _datetime_converter(field: serializers.DateTimeField):
+    field_timezone = getattr(field, 'timezone', field.default_timezone())
+
+    def to_iso(value):
+        if isinstance(value, str):
+            return value
+        if field_timezone is not None and value.tzinfo is not None:
+            value = value.astimezone(field_timezone)
+        value = value.isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+    return to_iso
+
+
+def _get_converter(field: serializers.Field):
+    """
+    A plain function producing field.to_representation(value) for a value
+    read with .values(), skipping DRF's per-field checks where the result is
+    known to be the value itself.
+    """
+    field_class = type(field)
+    if field_class in (serializers.CharField, serializers.EmailField, serializers.URLField,
+                       serializers.JSONField, serializers.BooleanField):
+        # values() already yields str / decoded JSON / bool for these.
+        return _identity
+    if field_class is serializers.IntegerField:
+        return int
+    if field_class is serializers.DateField and getattr(field, 'format', api_settings.DATE_FORMAT) == ISO_8601:
+        return _date_to_iso
+    if field_class is serializers.DateTimeField and getattr(field, 'format', api_settings.DATETIME_FORMAT) == ISO_8601:
+        return _datetime_converter(field)
+    return field.to_representation
+
+
+class ValuesSerializer:
+    """
+    Read-only counterpart of a ModelSerializer for list endpoints.
+
+    Rows are fetched with .values() instead of as model instances and mapped
+    with converters compiled once from the serializer's fields, producing the
+    same output as serializer_class(queryset, many=True).data without
+    instantiating models or walking DRF's field machinery per row.
+    Use get_values_serializer(), which returns None for serializers this
+    can't reproduce (method fields, dotted sources, relations...).
+    """
+
+    def __init__(self, serializer_class):
+        model = serializer_class.Meta.model
+        concrete = {field.attname for field in model._meta.concrete_fields}
+
+        self.columns = []
+        for name, field in serializer_class().fields.items():
+            if field.write_only:
+                continue
+            if field.source not in concrete or isinstance(field, serializers.RelatedField):
+                raise ValueError(f"{serializer_class.__name__}.{name} can't be read with values()")
+            self.columns.append((name, field.source, _get_converter(field)))
+
+    def get_queryset(self, queryset: QuerySet, *extra):
+        sources = dict.fromkeys([source for _, source, _ in self.columns] + list(extra))
+        return queryset.values(*sources)
+
+    def to_representation(self, row: dict):
+        return {
+            name: None if row[source] is None else convert(row[source])
+            for name, source, convert in self.columns
+        }
+
+    def serialize_rows(self, rows):
+        to_representation = self.to_representation
+        return [to_representation(row) for row in rows]
+
+    def serialize(self, queryset: QuerySet):
+        return self.serialize_rows(self.get_queryset(queryset))
+
+
+@lru_cache(maxsize=128)
+def get_values_serializer(serializer_class):
+    try:
+        return ValuesSerializer(serializer_class)
+    except ValueError:
+        return None
+
+
+def serialize_list(queryset: QuerySet, serializer_class):
+    """serializer_class(queryset, many=True).data, via .values() when possible."""
+    values_serializer = get_values_serializer(serializer_class)
+    if values_serializer is None:
+        return serializer_class(queryset, many=True).data
+    return values_serializer.serialize(queryset)
+
+
 class BaseModelSerializer(serializers.ModelSerializer):
     def __init__(self, *args, **kwargs):
         super(BaseModelSerializer, self).__init__(*args, **kwargs)
         for field_name, field in self.fields.items():
-            field.error_messages = get_error_messages_code(field_name)
+            field.error_messages = get_field_error_messages(field_name)
 
 
 def get_crud_serializer(model: models.Model, fields: list = [], update=True):
@@ -44,6 +157,11 @@ def get_crud_serializer(model: models.Model, fields: list = [], update=True):
     if not model:
         raise ValueError("Please provide model for the serializer")
 
+    return _build_crud_serializer(model, tuple(fields), update)
+
+
+@lru_cache(maxsize=256)
+def _build_crud_serializer(model: models.Model, fields: tuple, update: bool):
     class BaseCrudSerializer(BaseModelSerializer):
         def __init__(self, *args, **kwargs):
             if update:
@@ -62,7 +180,7 @@ def get_crud_serializer(model: models.Model, fields: list = [], update=True):
 
     BaseCrudSerializer.Meta.model = model
 
-    BaseCrudSerializer.Meta.fields = fields
+    BaseCrudSerializer.Meta.fields = list(fields)
 
     return BaseCrudSerializer
 
@@ -71,7 +189,17 @@ class BaseSerializerSerializer(serializers.Serializer):
     def __init__(self, *args, **kwargs):
         super(BaseSerializerSerializer, self).__init__(*args, **kwargs)
         for field_name, field in self.fields.items():
-            field.error_messages = get_error_messages_code(field_name)
+            field.error_messages = get_field_error_messages(field_name)
+
+
+@lru_cache(maxsize=1024)
+def get_field_error_messages(field_name: str):
+    """
+    get_error_messages_code(field_name), computed once per field name and
+    shared by every serializer field of that name, behind a read-only view
+    so no field can change the messages of the others.
+    """
+    return MappingProxyType(get_error_messages_code(field_name))
 
 
 def get_error_messages_code(field_name: str = None, extra_kwargs_fields: list = None):
@@ -96,25 +224,51 @@ def get_error_messages_code(field_name: str = None, extra_kwargs_fields: list =
         }
 
 
-def get_full_error_messages(field_name, field_error,error_messages_dict):
-    # print("101 field_name", field_name)
-    # print("101 field_error", field_error)
-    _base_messages_dict = {
-        f"{field_name}_null": f"{field_name} should not be null.",
-        f"{field_name}_required": f"Key : {field_name} is missing.",
-        f"{field_name}_blank": f"Please enter value for {field_name}.",
-        f"{field_name}_invalid": f"Please enter a valid value for Field : {field_name}.",
-        f"{field_name}_does_not_exist": "No record found.",
-        f"{field_name}_incorrect_type": f"Please enter a valid value for Field : {field_name}.",
-        f"{field_name}_min_value": "Please enter a value greater than min value.",
-        f"{field_name}_max_value": f"You have exceeded the maximum value for {field_name}",
-        f"{field_name}_max_length": f"You have exceeded the maximum length for {field_name}",
+@lru_cache(maxsize=1024)
+def get_base_error_messages(field_name):
+    """
+    The default friendly message for each error code of a field, built once
+    per field name (bounded) with interned keys.
+    """
+    return {
+        sys.intern(f"{field_name}_null"): f"{field_name} should not be null.",
+        sys.intern(f"{field_name}_required"): f"Key : {field_name} is missing.",
+        sys.intern(f"{field_name}_blank"): f"Please enter value for {field_name}.",
+        sys.intern(f"{field_name}_invalid"): f"Please enter a valid value for Field : {field_name}.",
+        sys.intern(f"{field_name}_does_not_exist"): "No record found.",
+        sys.intern(f"{field_name}_incorrect_type"): f"Please enter a valid value for Field : {field_name}.",
+        sys.intern(f"{field_name}_min_value"): "Please enter a value greater than min value.",
+        sys.intern(f"{field_name}_max_value"): f"You have exceeded the maximum value for {field_name}",
+        sys.intern(f"{field_name}_max_length"): f"You have exceeded the maximum length for {field_name}",
     }
-    _base_messages_dict = _base_messages_dict | error_messages_dict
-    # _base_messages_dict = _base_messages_dict | {
-    #     "non_field_errors": "Please check the fields and try again."
-    # }
-    return _base_messages_dict[field_error]
+
+
+_MISSING = object()
+
+
+def find_error_message(field_name, field_error, error_messages_dict, default=None):
+    """
+    Friendly message for field_error: error_messages_dict first, then the
+    field's defaults, else `default`. Does not raise for unknown or
+    unhashable errors.
+    """
+    try:
+        message = error_messages_dict.get(field_error, _MISSING)
+        if message is _MISSING:
+            message = get_base_error_messages(field_name).get(field_error, default)
+    except (AttributeError, TypeError):
+        # error_messages_dict is not a dict, or field_error is unhashable.
+        return default
+    return message
+
+
+def get_full_error_messages(field_name, field_error,error_messages_dict):
+    # Entries in error_messages_dict take precedence over the defaults;
+    # unknown codes raise KeyError.
+    message = find_error_message(field_name, field_error, error_messages_dict, _MISSING)
+    if message is _MISSING:
+        raise KeyError(field_error)
+    return message
 
 
 def get_error_message(serializer_errors, error_messages_dict) -> tuple:
@@ -141,14 +295,7 @@ def get_error_message(serializer_errors, error_messages_dict) -> tuple:
             friendly = error_messages_dict.get(raw, raw)
             return raw, friendly, error_field
 
-        try:
-            friendly = get_full_error_messages(
-                field_name=error_field,
-                field_error=raw,
-                error_messages_dict=error_messages_dict,
-            )
-        except Exception:
-            # If mapping is not available (e.g. custom validation raised a free-text message),
-            # fall back to the raw error text so clients still see a helpful message.
-            friendly = raw
+        # If mapping is not available (e.g. custom validation raised a free-text message),
+        # fall back to the raw error text so clients still see a helpful message.
+        friendly = find_error_message(error_field, raw, error_messages_dict, default=raw)
         return raw, friendly, error_field
@@ -0,0 +1,242 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+
+class PayloadCache:
+    """
+    Read-through cache for serialized list payloads.
+
+    Entries live in a per-worker LRU and, when API_CACHE['SHARED_CACHE_ALIAS']
+    is set, in a shared Django cache backend as well. Every model has a version
+    number that is part of the cache key; bumping the version (done by the
+    post_save/post_delete receivers in api/signals.py) makes all payloads built
+    from older data unreachable, so nothing has to be deleted explicitly.
+
+    With a shared backend the versions are stored there too, which keeps the
+    local LRUs of all workers consistent. Without one, a version bump only
+    reaches the worker that performed the write, so local entries then
+    expire after API_CACHE['LOCAL_TTL'] seconds: other workers serve a
+    write's old payload for at most that long.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._stats = {
+            'hits': 0,
+            'shared_hits': 0,
+            'misses': 0,
+            'invalidations': 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+    @property
+    def config(self):
+        return getattr(settings, 'API_CACHE', {})
+
+    @property
+    def enabled(self):
+        return self.config.get('ENABLED', True)
+
+    @property
+    def shared(self):
+        alias = self.config.get('SHARED_CACHE_ALIAS')
+        return caches[alias] if alias else None
+
+    @staticmethod
+    def _label(model):
+        return model._meta.label_lower
+
+    @staticmethod
+    def _initial_version():
+        # Seeding from the clock keeps versions increasing even if the shared
+        # backend evicts the version key and it has to be recreated.
+        return int(time.time() * 1000)
+
+    # ------------------------------------------------------------------
+    # Versions
+    # ------------------------------------------------------------------
+    def get_version(self, model):
+        label = self._label(model)
+        shared = self.shared
+        if shared is not None:
+            return shared.get_or_set(f'api:version:{label}', self._initial_version, timeout=None)
+
+        with self._lock:
+            if label not in self._versions:
+                self._versions[label] = self._initial_version()
+            return self._versions[label]
+
+    def bump_version(self, model):
+        label = self._label(model)
+        shared = self.shared
+        if shared is not None:
+            key = f'api:version:{label}'
+            try:
+                shared.incr(key)
+            except ValueError:
+                shared.set(key, self._initial_version(), timeout=None)
+
+        with self._lock:
+            self._versions[label] = max(
+                self._versions.get(label, 0) + 1, self._initial_version()
+            )
+            self._stats['invalidations'] += 1
+        logger.debug(f"Payload cache invalidated for {label}")
+
+    # ------------------------------------------------------------------
+    # Payloads
+    # ------------------------------------------------------------------
+    def get(self, model, variant, version=None):
+        """
+        The cached payload for (model, variant), or None on a miss.
+
+        Pass the version read before building a payload to get() and set()
+        alike, so a write that lands meanwhile can't file stale data under
+        the new version.
+        """
+        if not self.enabled:
+            return None
+
+        label = self._label(model)
+        version = version or self.get_version(model)
+        key = (label, version, variant)
+
+        value = self._get_local(key)
+        if value is not None:
+            return value
+
+        shared = self.shared
+        if shared is not None:
+            value = shared.get(f'api:payload:{label}:{version}:{variant}')
+            if value is not None:
+                self._store(key, value, shared_hit=True)
+                return value
+
+        with self._lock:
+            self._stats['misses'] += 1
+        return None
+
+    def set(self, model, variant, value, version=None):
+        if not self.enabled:
+            return
+
+        label = self._label(model)
+        version = version or self.get_version(model)
+        self._store((label, version, variant), value)
+        shared = self.shared
+        if shared is not None:
+            shared.set(
+                f'api:payload:{label}:{version}:{variant}', value,
+                timeout=self.config.get('TIMEOUT')
+            )
+
+    def get_or_set(self, model, variant, builder):
+        """
+        Return the cached payload for (model, variant), calling builder() and
+        storing its result on a miss.
+        """
+        if not self.enabled:
+            return builder()
+
+        version = self.get_version(model)
+        value = self.get(model, variant, version)
+        if value is None:
+            value = builder()
+            self.set(model, variant, value, version)
+        return value
+
+    # ------------------------------------------------------------------
+    # Async variants (for the async read path). The local LRU never blocks;
+    # the shared backend is reached through Django's async cache API.
+    # ------------------------------------------------------------------
+    async def aget_version(self, model):
+        shared = self.shared
+        if shared is None:
+            return self.get_version(model)
+        return await shared.aget_or_set(
+            f'api:version:{self._label(model)}', self._initial_version, timeout=None
+        )
+
+    async def aget(self, model, variant, version):
+        if not self.enabled:
+            return None
+
+        label = self._label(model)
+        key = (label, version, variant)
+        value = self._get_local(key)
+        if value is not None:
+            return value
+
+        shared = self.shared
+        if shared is not None:
+            value = await shared.aget(f'api:payload:{label}:{version}:{variant}')
+            if value is not None:
+                self._store(key, value, shared_hit=True)
+                return value
+
+        with self._lock:
+            self._stats['misses'] += 1
+        return None
+
+    async def aset(self, model, variant, value, version):
+        if not self.enabled:
+            return
+
+        label = self._label(model)
+        self._store((label, version, variant), value)
+        shared = self.shared
+        if shared is not None:
+            await shared.aset(
+                f'api:payload:{label}:{version}:{variant}', value,
+                timeout=self.config.get('TIMEOUT')
+            )
+
+    def _get_local(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return value
+
+    def _store(self, key, value, shared_hit=False):
+        max_entries = self.config.get('LOCAL_MAX_ENTRIES', 256)
+        # Versions from the shared backend keep local entries exact; purely
+        # local versions don't see other workers' writes, so bound the age.
+        expires_at = None
+        if self.shared is None:
+            expires_at = time.monotonic() + self.config.get('LOCAL_TTL', 5)
+        with self._lock:
+            if shared_hit:
+                self._stats['shared_hits'] += 1
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {**self._stats, 'entries': len(self._entries)}
+
+
+payload_cache = PayloadCache()
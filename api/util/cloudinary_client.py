@@ -0,0 +1,79 @@
+import logging
+import threading
+
+import cloudinary
+from django.conf import settings
+from urllib3 import PoolManager
+from urllib3.util import Retry, Timeout
+
+logger = logging.getLogger(__name__)
+
+_configured = False
+_http = None
+_http_lock = threading.Lock()
+
+
+def get_client_settings():
+    return getattr(settings, 'CLOUDINARY_CLIENT', {})
+
+
+def configure_cloudinary():
+    """
+    Configure the Cloudinary SDK once per process (called from ApiConfig.ready()).
+
+    Sets the credentials from settings.CLOUDINARY_STORAGE through the SDK's
+    public cloudinary.config(). API calls go through the SDK's own keep-alive
+    connection pool, whose urllib3 defaults retry failed connections but never
+    re-send an upload that reached the server; get_upload_options() adds the
+    configured timeouts to each call.
+    """
+    global _configured
+    if _configured:
+        return
+
+    storage = getattr(settings, 'CLOUDINARY_STORAGE', {})
+    if storage.get('CLOUD_NAME'):
+        cloudinary.config(
+            cloud_name=storage['CLOUD_NAME'],
+            api_key=storage['API_KEY'],
+            api_secret=storage['API_SECRET'],
+            secure=True,
+        )
+
+    _configured = True
+    logger.info("Cloudinary client configured")
+
+
+def get_timeout():
+    client = get_client_settings()
+    return Timeout(
+        connect=client.get('CONNECT_TIMEOUT', 5),
+        read=client.get('READ_TIMEOUT', 60),
+    )
+
+
+def get_upload_options():
+    """Options for the SDK's upload/destroy calls (the public `timeout` option)."""
+    return {'timeout': get_timeout()}
+
+
+def get_http():
+    """
+    This module's own keep-alive pool, for plain requests to delivery URLs
+    (see CloudinaryMediaStorage.exists()). Sized by POOL_MAXSIZE, with the
+    configured timeouts and retries; only idempotent requests go through it.
+    """
+    global _http
+    with _http_lock:
+        if _http is None:
+            client = get_client_settings()
+            _http = PoolManager(
+                **cloudinary.CERT_KWARGS,
+                maxsize=client.get('POOL_MAXSIZE', 10),
+                timeout=get_timeout(),
+                retries=Retry(
+                    total=client.get('RETRIES', 2),
+                    backoff_factor=client.get('RETRY_BACKOFF', 0.5),
+                ),
+            )
+        return _http
@@ -4,8 +4,24 @@ import os
 import logging
 from django.conf import settings
 
+from api.util.cloudinary_client import configure_cloudinary, get_upload_options
+
 logger = logging.getLogger(__name__)
 
+
+def get_file_size(file):
+    if isinstance(file, str):
+        return os.path.getsize(file) if os.path.exists(file) else 0
+    return getattr(file, 'size', None) or 0
+
+
+def get_file_path(file):
+    """A path for a local file or an uploaded file on disk, else the object itself."""
+    if hasattr(file, 'temporary_file_path'):
+        return file.temporary_file_path()
+    return file
+
+
 def upload_to_cloudinary(local_path, folder="portfolio_uploads"):
     """
     Uploads a local file to Cloudinary and deletes the local file after success.
@@ -21,22 +37,30 @@ def upload_to_cloudinary(local_path, folder="portfolio_uploads"):
         Exception: If the upload fails.
     """
     try:
-        # Check if settings are configured
-        if hasattr(settings, 'CLOUDINARY_STORAGE'):
-             # Configure cloudinary with settings
-            cloudinary.config(
-                cloud_name=settings.CLOUDINARY_STORAGE['CLOUD_NAME'],
-                api_key=settings.CLOUDINARY_STORAGE['API_KEY'],
-                api_secret=settings.CLOUDINARY_STORAGE['API_SECRET']
-            )
+        # Credentials are set up once in ApiConfig.ready(); this is a no-op
+        # afterwards.
+        configure_cloudinary()
 
         # Upload the file
         logger.info(f"Uploading file: {local_path} to folder: {folder}")
-        result = cloudinary.uploader.upload(
-            local_path,
-            folder=folder,
-            resource_type="auto" # Auto detect file type (image, video, raw for pdf etc)
-        )
+        chunk_size = getattr(settings, 'UPLOAD_STREAMING', {}).get('REMOTE_CHUNK_SIZE', 6 * 1024 * 1024)
+        if get_file_size(local_path) > chunk_size:
+            # Chunked upload API: sends the file chunk_size bytes at a time
+            # instead of reading it into memory whole.
+            result = cloudinary.uploader.upload_large(
+                get_file_path(local_path),
+                folder=folder,
+                resource_type="auto",
+                chunk_size=chunk_size,
+                **get_upload_options(),
+            )
+        else:
+            result = cloudinary.uploader.upload(
+                local_path,
+                folder=folder,
+                resource_type="auto", # Auto detect file type (image, video, raw for pdf etc)
+                **get_upload_options(),
+            )
 
         # Delete local file after upload ONLY if it's a path string
         if isinstance(local_path, str) and os.path.exists(local_path):
@@ -50,3 +74,4 @@ def upload_to_cloudinary(local_path, folder="portfolio_uploads"):
     except Exception as error:
         logger.error(f"Error uploading to Cloudinary: {error}")
         raise error
+
@@ -0,0 +1,115 @@
+import hashlib
+from functools import wraps
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from api.util.cache_util import payload_cache
+
+
+def get_validator_queryset(model, pk=None):
+    queryset = model.objects.all()
+    if pk is not None:
+        queryset = queryset.filter(pk=pk)
+    return queryset
+
+
+VALIDATOR_AGGREGATES = {'last_modified': Max('modified_at'), 'count': Count('pk')}
+
+
+def compute_validators(model, pk=None):
+    """
+    Build (etag, last_modified) for a model's list, or a single row when pk is
+    given, from one aggregate query. No rows are loaded.
+
+    The row count is part of the ETag so deletions change it even though they
+    leave Max('modified_at') untouched. Returns (None, None) when nothing
+    matches, letting the view produce its usual response (e.g. a 404).
+    """
+    result = get_validator_queryset(model, pk).aggregate(**VALIDATOR_AGGREGATES)
+    return make_validators(model, pk, result)
+
+
+async def acompute_validators(model, pk=None):
+    result = await get_validator_queryset(model, pk).aaggregate(**VALIDATOR_AGGREGATES)
+    return make_validators(model, pk, result)
+
+
+def make_validators(model, pk, result):
+    if not result['count']:
+        return None, None
+
+    last_modified = result['last_modified']
+    fingerprint = f"{model._meta.label_lower}:{pk}:{result['count']}:{last_modified.isoformat()}"
+    etag = '"%s"' % hashlib.md5(fingerprint.encode()).hexdigest()
+    return etag, last_modified
+
+
+def get_validators(model, pk=None):
+    """compute_validators() memoised in the payload cache for the current model version."""
+    variant = 'validators' if pk is None else f'validators:{pk}'
+    return payload_cache.get_or_set(model, variant, lambda: compute_validators(model, pk))
+
+
+async def aget_validators(model, pk=None):
+    """Async get_validators(), sharing its cache entries."""
+    variant = 'validators' if pk is None else f'validators:{pk}'
+    version = await payload_cache.aget_version(model)
+    validators = await payload_cache.aget(model, variant, version)
+    if validators is None:
+        validators = await acompute_validators(model, pk)
+        await payload_cache.aset(model, variant, validators, version)
+    return validators
+
+
+def add_validator_headers(response, etag, last_modified):
+    response.headers.setdefault('ETag', etag)
+    response.headers.setdefault('Last-Modified', http_date(int(last_modified.timestamp())))
+    # Let browsers and CDNs keep the body but always revalidate it.
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+def combine_validators(validators):
+    """Merge several (etag, last_modified) pairs into one for a composite document."""
+    validators = [(etag, last_modified) for etag, last_modified in validators if etag]
+    if not validators:
+        return None, None
+    etag = '"%s"' % hashlib.md5(
+        ':'.join(etag for etag, _ in validators).encode()
+    ).hexdigest()
+    return etag, max(last_modified for _, last_modified in validators)
+
+
+def conditional_get(model=None):
+    """
+    Decorator for APIView.get answering If-None-Match / If-Modified-Since with
+    a 304 before the handler runs, and adding ETag / Last-Modified to 200s.
+
+    Validators come from `model` (list, or detail when a pk kwarg is present)
+    or, when no model is given, from view.get_validators(request, ...).
+    """
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(view, request, *args, **kwargs):
+            if model is not None:
+                etag, last_modified = get_validators(model, kwargs.get('pk'))
+            else:
+                etag, last_modified = view.get_validators(request, *args, **kwargs)
+
+            if etag is None:
+                return view_method(view, request, *args, **kwargs)
+
+            timestamp = int(last_modified.timestamp())
+            response = get_conditional_response(
+                request, etag=etag, last_modified=timestamp
+            )
+            if response is None:
+                response = view_method(view, request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+
+            return add_validator_headers(response, etag, last_modified)
+        return wrapper
+    return decorator
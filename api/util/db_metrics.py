@@ -0,0 +1,20 @@
+from django.db import connections
+
+
+def get_pool_stats(alias='default'):
+    """
+    Counters of a database's psycopg connection pool, or None when the
+    connection is not pooled (DB_POOL=False, or not PostgreSQL).
+
+    Besides psycopg's own counters (pool_size, pool_available,
+    requests_waiting, requests_num, requests_wait_ms, ...) this includes the
+    average time a request waited for a connection, in milliseconds.
+    """
+    pool = getattr(connections[alias], 'pool', None)
+    if pool is None:
+        return None
+
+    stats = pool.get_stats()
+    requests = stats.get('requests_num', 0)
+    stats['avg_wait_ms'] = round(stats.get('requests_wait_ms', 0) / requests, 3) if requests else 0
+    return stats
@@ -0,0 +1,138 @@
+import logging
+import multiprocessing
+import os
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+
+logger = logging.getLogger(__name__)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_config():
+    return getattr(settings, 'IMAGE_VARIANTS', {})
+
+
+def get_pool():
+    """
+    The process pool that renders derivatives. Resizing and encoding are CPU
+    bound, so they run outside the web and upload-job processes entirely.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=get_config().get('MAX_WORKERS', 2),
+                # The parent runs request and upload threads; spawn avoids forking them.
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        return _pool
+
+
+def get_variant_field(model, field):
+    """Name of the `<field>_variants` JSONField of model, or None if it has none."""
+    name = f"{field}_variants"
+    if any(model_field.name == name for model_field in model._meta.get_fields()):
+        return name
+    return None
+
+
+def get_formats():
+    supported = []
+    for image_format in get_config().get('FORMATS', ['webp', 'avif']):
+        if features.check(image_format):
+            supported.append(image_format)
+        else:
+            logger.warning(f"Pillow has no {image_format} support, skipping those variants")
+    return supported
+
+
+def render_variants(source_path, output_dir, widths, formats, quality):
+    """
+    Write resized copies of an image, one per width and format.
+
+    Runs in the process pool, so it only takes plain arguments. Widths at or
+    above the original's are skipped (images are never upscaled), and a file
+    Pillow cannot read as an image yields no variants.
+
+    Returns:
+        list: (format, width, path) tuples of the written files.
+    """
+    try:
+        with Image.open(source_path) as opened:
+            image = ImageOps.exif_transpose(opened)
+            image.load()
+    except (UnidentifiedImageError, OSError):
+        return []
+
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'transparency' in image.info or 'A' in image.mode else 'RGB')
+
+    sizes = [width for width in sorted(set(widths)) if width < image.width] or [image.width]
+    stem = uuid.uuid4().hex
+    rendered = []
+    for width in sizes:
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.Resampling.LANCZOS)
+        for image_format in formats:
+            path = os.path.join(output_dir, f"{stem}-{width}w.{image_format}")
+            resized.save(path, image_format.upper(), quality=quality)
+            rendered.append((image_format, width, path))
+    return rendered
+
+
+def render_job_variants(model, files):
+    """
+    Render the derivatives of every spooled image whose field has a
+    `<field>_variants` counterpart on model, in parallel on the process pool.
+
+    Args:
+        files (dict): The upload job's entries, field -> {"path", "folder", ...}.
+
+    Returns:
+        dict: field -> list of (format, width, path) tuples. Fields that were
+            uploaded but produced no variants map to an empty list, so their
+            stale variants get cleared.
+    """
+    config = get_config()
+    fields = [field for field in files if get_variant_field(model, field)]
+    if not config.get('ENABLED', True) or not fields:
+        return {}
+
+    formats = get_formats()
+    output_dir = os.path.dirname(files[fields[0]]['path'])
+    futures = {
+        field: get_pool().submit(
+            render_variants, files[field]['path'], output_dir,
+            config.get('WIDTHS', [320, 640, 1280]), formats, config.get('QUALITY', 80),
+        )
+        for field in fields
+    }
+
+    rendered = {}
+    for field, future in futures.items():
+        try:
+            rendered[field] = future.result()
+        except Exception as error:
+            # The original still gets uploaded; it is just served without variants.
+            logger.error(f"Error rendering variants for {field}: {error}")
+            rendered[field] = []
+    return rendered
+
+
+def variant_key(field, image_format, width):
+    return f"{field}:{image_format}:{width}"
+
+
+def build_variant_map(field, rendered, uploads):
+    """srcset-ready map of one field: {format: {width: url}}, widths ascending."""
+    variants = {}
+    for image_format, width, _ in rendered:
+        url = uploads[variant_key(field, image_format, width)].get('secure_url')
+        variants.setdefault(image_format, {})[str(width)] = url
+    return variants
@@ -0,0 +1,110 @@
+import base64
+import binascii
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+from api.util.base_serializer import get_values_serializer
+from api.util.query_params import DEFAULT_ORDERING, InvalidQueryParam
+from api.util.responses import APIResponse
+
+
+class InvalidCursor(InvalidQueryParam):
+    return_code = APIResponse.Codes.INVALID_CURSOR
+
+
+def encode_cursor(created_at, pk):
+    raw = f"{created_at.isoformat()}|{pk}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, pk = base64.urlsafe_b64decode(padded).decode().split('|')
+        created_at = parse_datetime(created_at)
+        pk = int(pk)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor(cursor)
+    if created_at is None:
+        raise InvalidCursor(cursor)
+    return created_at, pk
+
+
+class KeysetPaginator:
+    """
+    Cursor pagination over the views' ('-created_at', '-id') ordering.
+
+    Each page is fetched with a WHERE on the last row's (created_at, id) instead
+    of an OFFSET, so the cost of a page does not grow with the table and rows
+    inserted meanwhile never shift or duplicate results. The cursor is an opaque
+    url-safe token; clients just pass back `next_cursor`.
+    """
+    ordering = DEFAULT_ORDERING
+
+    def __init__(self, request):
+        config = getattr(settings, 'API_PAGINATION', {})
+        # A DRF Request, or a plain HttpRequest on the async read path
+        params = getattr(request, 'query_params', request.GET)
+        self.max_page_size = config.get('MAX_PAGE_SIZE', 100)
+        self.default_page_size = config.get('PAGE_SIZE', 20)
+        self.cursor = params.get('cursor') or None
+        self.page_size = self.get_page_size(params.get('page_size'), self.default_page_size)
+        self.position = decode_cursor(self.cursor) if self.cursor else None
+
+    def get_page_size(self, requested, default):
+        try:
+            page_size = int(requested) if requested else default
+        except ValueError:
+            page_size = default
+        return max(1, min(page_size, self.max_page_size))
+
+    @staticmethod
+    def is_requested(request):
+        params = getattr(request, 'query_params', request.GET)
+        return 'cursor' in params or 'page_size' in params
+
+    @property
+    def cache_variant(self):
+        """Cache variant of the page, or None: only first pages of the default size are cached."""
+        if self.cursor or self.page_size != self.default_page_size:
+            return None
+        return f'page:{self.page_size}'
+
+    def paginate_queryset(self, queryset):
+        """Return (rows, next_cursor) for the current page."""
+        queryset = queryset.order_by(*self.ordering)
+        if self.position:
+            created_at, pk = self.position
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk)
+            )
+
+        rows = list(queryset[:self.page_size + 1])
+        next_cursor = None
+        if len(rows) > self.page_size:
+            rows = rows[:self.page_size]
+            last = rows[-1]
+            if isinstance(last, dict):
+                next_cursor = encode_cursor(last['created_at'], last['id'])
+            else:
+                next_cursor = encode_cursor(last.created_at, last.pk)
+        return rows, next_cursor
+
+    def get_page_data(self, queryset, serializer_class):
+        values_serializer = get_values_serializer(serializer_class)
+        if values_serializer is None:
+            rows, next_cursor = self.paginate_queryset(queryset)
+            results = serializer_class(rows, many=True).data
+        else:
+            # created_at and id are read as well, for the cursor.
+            rows, next_cursor = self.paginate_queryset(
+                values_serializer.get_queryset(queryset, 'created_at', 'id')
+            )
+            results = values_serializer.serialize_rows(rows)
+        return {
+            'results': results,
+            'next_cursor': next_cursor,
+            'page_size': self.page_size,
+        }
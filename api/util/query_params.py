@@ -0,0 +1,86 @@
+from api.util.base_serializer import get_response_serializer
+from api.util.responses import APIResponse
+
+DEFAULT_ORDERING = ('-created_at', '-id')
+
+
+class InvalidQueryParam(ValueError):
+    return_code = APIResponse.Codes.INVALID_QUERY_PARAM
+
+
+class ListQuery:
+    """
+    Parses the list query parameters a view allows and applies them at the
+    ORM level:
+
+    - ?<field>=value      exact-match filters, for the view's filter_fields
+    - ?fields=a,b         sparse fieldsets, fetched with .only() and rendered
+                          by a serializer limited to those fields
+    - ?ordering=-a,b      ordering, for the view's ordering_fields
+    """
+
+    def __init__(self, request, model, filter_fields=(), ordering_fields=()):
+        # A DRF Request, or a plain HttpRequest on the async read path
+        params = getattr(request, 'query_params', request.GET)
+        self.model = model
+        self.filters = {
+            name: params[name] for name in filter_fields if name in params
+        }
+        self.fields = self.parse_fields(params.get('fields'))
+        self.ordering = self.parse_ordering(params.get('ordering'), ordering_fields)
+
+    def parse_fields(self, value):
+        if not value:
+            return None
+        fields = [name.strip() for name in value.split(',') if name.strip()]
+        model_fields = {field.name for field in self.model._meta.concrete_fields}
+        if not fields or any(name not in model_fields for name in fields):
+            raise InvalidQueryParam('fields')
+        return tuple(fields)
+
+    @staticmethod
+    def parse_ordering(value, ordering_fields):
+        if not value:
+            return DEFAULT_ORDERING
+        ordering = [name.strip() for name in value.split(',') if name.strip()]
+        if not ordering or any(name.lstrip('-') not in ordering_fields for name in ordering):
+            raise InvalidQueryParam('ordering')
+        # Keep the result deterministic for rows with equal sort keys.
+        return tuple(ordering) + ('-id',)
+
+    @property
+    def is_default(self):
+        return not self.filters and not self.fields and self.ordering == DEFAULT_ORDERING
+
+    def get_choices(self, name):
+        return {value for value, _label in self.model._meta.get_field(name).flatchoices}
+
+    @property
+    def cache_variant(self):
+        """
+        Cache variant of the query, or None if its result isn't cached.
+
+        Only a bounded set of queries is cached - filters on one of a field's
+        choices and orderings by a single field - so clients can't add a
+        cache entry per query string. Sparse fieldsets aren't cached.
+        """
+        if self.is_default:
+            return 'list'
+        if self.fields or len(self.ordering) > len(DEFAULT_ORDERING):
+            return None
+        if any(value not in self.get_choices(name) for name, value in self.filters.items()):
+            return None
+        filters = '&'.join(f'{name}={value}' for name, value in sorted(self.filters.items()))
+        return f"list:{filters}:{','.join(self.ordering)}"
+
+    def apply(self, queryset):
+        queryset = queryset.filter(**self.filters).order_by(*self.ordering)
+        if self.fields:
+            # created_at is needed for keyset cursors; the pk is always loaded.
+            queryset = queryset.only(*self.fields, 'created_at')
+        return queryset
+
+    def get_serializer_class(self, serializer_class):
+        if not self.fields:
+            return serializer_class
+        return get_response_serializer(self.model, fields=list(self.fields))
@@ -0,0 +1,54 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson when it is installed.
+
+    orjson serializes dicts, lists, datetimes, dates, UUIDs and the like
+    natively in Rust, which is several times faster than the stdlib `json`
+    module DRF uses. Anything else (Decimal, lazy strings, ...) is handed to
+    DRF's own encoder, and data orjson can't encode at all (integers beyond 64
+    bits) is rendered by JSONRenderer. orjson only writes compact JSON, so
+    without orjson, or when REST_FRAMEWORK asks for anything else (indentation
+    other than 2, COMPACT_JSON = False, UNICODE_JSON = False or
+    STRICT_JSON = False), it simply is JSONRenderer.
+
+    The result parses to the same value as JSONRenderer's, but isn't always
+    byte-identical: floats may be spelled differently (1e16 rather than
+    1e+16), and NaN/Infinity are written as null where JSONRenderer raises.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+        if (
+            orjson is None
+            or indent not in (None, 2)
+            or (indent is None and not self.compact)
+            or self.ensure_ascii
+            or not self.strict
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Z for UTC and non-string keys, as DRF's JSONEncoder produces them.
+        option = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=option)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Like JSONRenderer, escape U+2028/U+2029 so the output is valid JavaScript.
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
@@ -0,0 +1,108 @@
+import hashlib
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# Per-request routing state set by ReplicaRoutingMiddleware:
+# {'use_replica': bool, 'changed': {model label: bool}}
+_request_state = ContextVar('replica_request_state', default=None)
+
+
+def get_config():
+    return getattr(settings, 'DATABASE_REPLICAS', {})
+
+
+def get_cache():
+    return caches[get_config().get('CACHE_ALIAS') or 'default']
+
+
+def get_sticky_key(request):
+    """Identifies the client by its Authorization header, hashed (None for anonymous)."""
+    authorization = request.META.get('HTTP_AUTHORIZATION')
+    if not authorization:
+        return None
+    return 'api:replica:sticky:' + hashlib.sha256(authorization.encode()).hexdigest()
+
+
+def note_model_changed(model):
+    """
+    Record a committed write to model. For the next LAG_SECONDS its reads
+    stay on the primary for every client, so no reader (or cache) picks up
+    rows from a replica that hasn't caught up yet.
+    """
+    if get_config().get('ALIASES'):
+        get_cache().set(f'api:replica:changed:{model._meta.label_lower}', 1, get_config().get('LAG_SECONDS', 5))
+
+
+def model_recently_changed(model, state):
+    label = model._meta.label_lower
+    if label not in state['changed']:
+        state['changed'][label] = get_cache().get(f'api:replica:changed:{label}') is not None
+    return state['changed'][label]
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Lets reads of safe API requests go to a replica, unless the client wrote
+    within the last STICKY_SECONDS (read-your-writes for the admin who just
+    saved). Successful writes make the client sticky.
+
+    The sticky clients and recently changed models live in the cache named by
+    DATABASE_REPLICAS['CACHE_ALIAS']. Without REDIS_URL that is the per-process
+    LocMem cache: a write is then only seen by the worker that handled it, and
+    a client's next read can land on another worker that sends it to a lagging
+    replica. Run several workers with replicas only together with REDIS_URL.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        config = get_config()
+        if not request.path.startswith(config.get('PATH_PREFIX', '/api/')):
+            return self.get_response(request)
+
+        sticky_key = get_sticky_key(request)
+        safe = request.method in SAFE_METHODS
+        use_replica = safe and not (sticky_key and get_cache().get(sticky_key) is not None)
+
+        token = _request_state.set({'use_replica': use_replica, 'changed': {}})
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_state.reset(token)
+
+        if not safe and sticky_key and response.status_code < 400:
+            get_cache().set(sticky_key, 1, config.get('STICKY_SECONDS', 5))
+        return response
+
+
+class ReplicaRouter:
+    """
+    Sends reads to a random replica (DATABASE_REPLICAS['ALIASES']) while a
+    request routed by ReplicaRoutingMiddleware allows it, and everything
+    else, including all writes and migrations, to the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _request_state.get()
+        if not state or not state['use_replica']:
+            return 'default'
+        if model_recently_changed(model, state):
+            return 'default'
+        return random.choice(get_config()['ALIASES'])
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get their schema through replication.
+        return db == 'default'
@@ -0,0 +1,129 @@
+from functools import wraps
+
+from django.http import HttpResponse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from api.util.cache_util import payload_cache
+from api.util.pagination import KeysetPaginator
+from api.util.query_params import InvalidQueryParam, ListQuery
+
+
+# Query parameters every list endpoint understands (see ListQuery and
+# KeysetPaginator); `format` is DRF's renderer override.
+LIST_QUERY_PARAMS = ('cursor', 'page_size', 'fields', 'ordering', 'format')
+
+
+def get_query_params(view, kwargs):
+    """The query parameters the response of view can depend on."""
+    if 'pk' in kwargs:
+        return ('format',)
+    return (
+        LIST_QUERY_PARAMS + tuple(getattr(view, 'filter_fields', ()))
+        + tuple(getattr(view, 'extra_query_params', ()))
+    )
+
+
+def get_query_variant(request, view, model, kwargs):
+    """
+    The canonical form of the parsed query, or None if it isn't cached.
+    Raises InvalidQueryParam for bad parameters.
+    """
+    if 'pk' in kwargs:
+        return ''
+    if hasattr(view, 'get_cache_variant'):
+        return view.get_cache_variant(request)
+
+    variant = ListQuery(request, model, view.filter_fields, view.ordering_fields).cache_variant
+    if variant is None or not KeysetPaginator.is_requested(request):
+        return variant
+    page = KeysetPaginator(request).cache_variant
+    return page and f'{variant}:{page}'
+
+
+def get_variant_prefix(request, view, model, kwargs, indent):
+    """The versionless part of get_response_variant(), or None."""
+    recognised = get_query_params(view, kwargs)
+    if any(name not in recognised for name in request.GET):
+        return None
+    try:
+        query = get_query_variant(request, view, model, kwargs)
+    except InvalidQueryParam:
+        return None
+    if query is None:
+        return None
+
+    args = ':'.join(f'{name}={value}' for name, value in sorted(kwargs.items()))
+    return f'response:{args}:{query}:indent={indent}'
+
+
+def get_response_variant(request, view, models, kwargs, indent=None):
+    """
+    Cache variant of a GET, or None if its response isn't cached.
+
+    Made of parsed values only: the URL kwargs, the canonical query (see
+    ListQuery.cache_variant, KeysetPaginator.cache_variant or the view's
+    get_cache_variant()), the validated indent and the versions of any
+    further models the response depends on. Unknown parameters and queries
+    outside the cached set (cursors, sparse fieldsets, free-form filter
+    values, ...) return None, so the number of entries per endpoint stays
+    bounded whatever clients send.
+    """
+    prefix = get_variant_prefix(request, view, models[0], kwargs, indent)
+    if prefix is None:
+        return None
+    versions = ':'.join(str(payload_cache.get_version(model)) for model in models[1:])
+    return f'{prefix}:{versions}'
+
+
+async def aget_response_variant(request, view, models, kwargs, indent=None):
+    """Async get_response_variant(), for the async read path."""
+    prefix = get_variant_prefix(request, view, models[0], kwargs, indent)
+    if prefix is None:
+        return None
+    versions = ':'.join([str(await payload_cache.aget_version(model)) for model in models[1:]])
+    return f'{prefix}:{versions}'
+
+
+def cached_response(*models):
+    """
+    Decorator for APIView.get caching the fully rendered JSON envelope.
+
+    On a hit the stored bytes go straight out in a plain HttpResponse: no
+    query, serializer or renderer runs. Entries are stored under the first
+    model's version (and include the versions of the other models), so any
+    write to one of them makes the response unreachable. Only 200 responses
+    to JSON requests are cached; the browsable API always renders normally,
+    and so do requests outside the cached variants (see get_response_variant).
+
+    Applied inside @conditional_get, so 304s are still answered first.
+    """
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(view, request, *args, **kwargs):
+            renderer = request.accepted_renderer
+            if not isinstance(renderer, JSONRenderer):
+                return view_method(view, request, *args, **kwargs)
+
+            indent = renderer.get_indent(request.accepted_media_type, {})
+            variant = get_response_variant(request, view, models, kwargs, indent)
+            if variant is None:
+                return view_method(view, request, *args, **kwargs)
+
+            version = payload_cache.get_version(models[0])
+            body = payload_cache.get(models[0], variant, version)
+            if body is not None:
+                return HttpResponse(body, content_type=renderer.media_type)
+
+            response = view_method(view, request, *args, **kwargs)
+            if not isinstance(response, Response) or response.status_code != 200:
+                return response
+
+            body = renderer.render(
+                response.data, request.accepted_media_type,
+                {'view': view, 'request': request, 'response': response},
+            )
+            payload_cache.set(models[0], variant, body, version)
+            return HttpResponse(body, content_type=renderer.media_type)
+        return wrapper
+    return decorator
@@ -1,5 +1,7 @@
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.views import exception_handler
 from api.util.base_serializer import get_error_message
 
 class APIResponse:
@@ -58,6 +60,15 @@ class APIResponse:
         CONTACTINFO_RETRIEVED = "CONTACTINFO_RETRIEVED"
         CONTACTINFO_CREATED = "CONTACTINFO_CREATED"
         CONTACTINFO_UPDATED = "CONTACTINFO_UPDATED"
+
+        # Portfolio codes
+        PORTFOLIO_RETRIEVED = "PORTFOLIO_RETRIEVED"
+
+        # Upload job codes
+        UPLOAD_JOB_RETRIEVED = "UPLOAD_JOB_RETRIEVED"
+
+        # Metrics codes
+        METRICS_RETRIEVED = "METRICS_RETRIEVED"
         
 
         # -------------------------
@@ -84,6 +95,11 @@ class APIResponse:
         USER_DELETED = "USER_DELETED"
         EMAIL_ALREADY_EXISTS = "EMAIL_ALREADY_EXISTS"
         PASSWORD_LENGTH_INVALID = "PASSWORD_LENGTH_INVALID"
+        INVALID_SECTION = "INVALID_SECTION"
+        INVALID_CURSOR = "INVALID_CURSOR"
+        INVALID_QUERY_PARAM = "INVALID_QUERY_PARAM"
+        RATE_LIMITED = "RATE_LIMITED"
+        UPLOAD_TOO_LARGE = "UPLOAD_TOO_LARGE"
 
 
         # -------------------------
@@ -134,6 +150,15 @@ class APIResponse:
             CONTACT_RETRIEVED: "Contact messages retrieved successfully.",
             CONTACT_CREATED: "Contact message sent successfully.",
             CONTACT_UPDATED: "Contact message updated successfully.",
+
+            # Portfolio messages
+            PORTFOLIO_RETRIEVED: "Portfolio retrieved successfully.",
+
+            # Upload job messages
+            UPLOAD_JOB_RETRIEVED: "Upload job retrieved successfully.",
+
+            # Metrics messages
+            METRICS_RETRIEVED: "Metrics retrieved successfully.",
         }
 
         # -------------------------
@@ -161,6 +186,11 @@ class APIResponse:
             USER_DELETED: "User account deleted.",
             EMAIL_ALREADY_EXISTS: "Email already exists.",
             PASSWORD_LENGTH_INVALID: "Password must be 8-16 characters long and contain at least one number and one special character.",
+            INVALID_SECTION: "Unknown portfolio section requested.",
+            INVALID_CURSOR: "Invalid pagination cursor.",
+            INVALID_QUERY_PARAM: "Invalid filter, fields or ordering parameter.",
+            RATE_LIMITED: "Too many requests. Please try again later.",
+            UPLOAD_TOO_LARGE: "Uploaded file is too large.",
         }
 
     # --------------------------------------------------------
@@ -242,6 +272,18 @@ class APIResponse:
         return Response(payload, status=status.HTTP_400_BAD_REQUEST)
 
 
+def api_exception_handler(exc, context):
+    """
+    REST_FRAMEWORK['EXCEPTION_HANDLER']. API exceptions that carry a
+    return_code (e.g. UploadTooLarge, raised while any view parses its body)
+    are answered with the APIResponse envelope; the rest as DRF does.
+    """
+    return_code = getattr(exc, 'return_code', None)
+    if isinstance(exc, APIException) and return_code is not None:
+        return APIResponse.get_error_response(return_code, exc.status_code)
+    return exception_handler(exc, context)
+
+
 # Utility function to create standardized API responses
 def create_response(success, message, data=None, errors=None, status_code=status.HTTP_200_OK):
     response_data = {
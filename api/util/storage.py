@@ -0,0 +1,291 @@
+import hashlib
+import logging
+import os
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import cloudinary.uploader
+from django.apps import apps
+from django.conf import settings
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Coalesce
+from django.utils.module_loading import import_string
+
+from api.util.cloudinary_client import get_http, get_upload_options
+from api.util.cloudinary_util import get_file_path, get_file_size, upload_to_cloudinary
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.avif', '.svg', '.bmp', '.ico'}
+
+
+def read_chunks(source, chunk_size=1024 * 1024):
+    """Yield the content of a local path or an uploaded file."""
+    if isinstance(source, str):
+        with open(source, 'rb') as opened:
+            while chunk := opened.read(chunk_size):
+                yield chunk
+    else:
+        source.seek(0)
+        yield from source.chunks(chunk_size)
+
+
+def hash_file(file):
+    digest = hashlib.sha256()
+    for chunk in read_chunks(get_file_path(file)):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+class MediaStorage(ABC):
+    """
+    Interface of the media storage backends selected by MEDIA_STORAGE_BACKEND.
+
+    upload() returns a dict with at least `secure_url`, `public_id` and
+    `resource_type`, matching the shape of a Cloudinary upload result.
+    """
+
+    @abstractmethod
+    def upload(self, file, folder):
+        ...
+
+    @abstractmethod
+    def destroy(self, public_id, resource_type=None):
+        ...
+
+    @abstractmethod
+    def exists(self, public_id, secure_url):
+        """Whether a file uploaded earlier is still stored."""
+
+
+class CloudinaryMediaStorage(MediaStorage):
+    def upload(self, file, folder):
+        return upload_to_cloudinary(file, folder=folder)
+
+    def destroy(self, public_id, resource_type=None):
+        cloudinary.uploader.destroy(public_id, resource_type=resource_type or 'image', **get_upload_options())
+
+    def exists(self, public_id, secure_url):
+        # A HEAD on the delivery URL; unlike the Admin API it counts against
+        # no rate limit.
+        return get_http().request('HEAD', secure_url).status == 200
+
+
+class LocalMediaStorage(MediaStorage):
+    """
+    Stores files under MEDIA_ROOT, named by the SHA-256 of their content, and
+    serves them from MEDIA_PUBLIC_BASE_URL + MEDIA_URL (see api.views.media_file).
+
+    Identical content always maps to the same path, so re-uploads are free and
+    the files can be cached forever. Uploads make no external calls.
+    """
+
+    def upload(self, file, folder):
+        source = get_file_path(file)
+        extension = os.path.splitext(source if isinstance(source, str) else file.name)[1].lower()
+
+        os.makedirs(settings.MEDIA_ROOT, exist_ok=True)
+        staging = os.path.join(settings.MEDIA_ROOT, f".{uuid.uuid4().hex}.part")
+        digest = hashlib.sha256()
+        with open(staging, 'wb') as destination:
+            for chunk in read_chunks(source):
+                digest.update(chunk)
+                destination.write(chunk)
+
+        sha256 = digest.hexdigest()
+        public_id = f"{folder}/{sha256[:2]}/{sha256}{extension}"
+        path = os.path.join(settings.MEDIA_ROOT, public_id)
+        existing = os.path.exists(path)
+        if existing:
+            os.remove(staging)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(staging, path)
+
+        # Match upload_to_cloudinary, which removes a local source path after uploading.
+        if isinstance(file, str) and os.path.exists(file):
+            os.remove(file)
+
+        logger.info(f"File stored locally: {public_id}")
+        return {
+            'secure_url': f"{settings.MEDIA_PUBLIC_BASE_URL.rstrip('/')}{settings.MEDIA_URL}{public_id}",
+            'public_id': public_id,
+            'resource_type': 'image' if extension in IMAGE_EXTENSIONS else 'raw',
+            'bytes': os.path.getsize(path),
+            # The file was already stored by an earlier upload and may be shared.
+            'existing': existing,
+        }
+
+    def destroy(self, public_id, resource_type=None):
+        path = os.path.join(settings.MEDIA_ROOT, public_id)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def exists(self, public_id, secure_url):
+        return os.path.exists(os.path.join(settings.MEDIA_ROOT, public_id))
+
+
+@lru_cache(maxsize=None)
+def get_storage():
+    return import_string(settings.MEDIA_STORAGE_BACKEND)()
+
+
+class BatchUploadError(Exception):
+    """
+    Raised by upload_files when at least one file failed.
+    `errors` maps each failed key to its error message.
+    """
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__("; ".join(f"{key}: {message}" for key, message in errors.items()))
+
+
+def reuse_asset(storage, file, sha256):
+    """
+    The stored MediaAsset result for content already uploaded, or None.
+
+    The file must still be in the storage; an asset whose file is gone (or
+    can't be checked) is uploaded again, and a missing one is forgotten. On a
+    hit the local source is removed, as an upload would have done. The reuse
+    is counted by record_assets() once the whole batch succeeded.
+    """
+    MediaAsset = apps.get_model('api', 'MediaAsset')
+    asset = MediaAsset.objects.filter(sha256=sha256).first()
+    if asset is None:
+        return None
+
+    try:
+        stored = storage.exists(asset.public_id, asset.secure_url)
+    except Exception as error:
+        logger.warning(f"Could not check stored asset {asset.public_id}, uploading again: {error}")
+        return None
+    if not stored:
+        logger.warning(f"Stored asset {asset.public_id} no longer exists, uploading again")
+        MediaAsset.objects.filter(pk=asset.pk).delete()
+        return None
+
+    if isinstance(file, str) and os.path.exists(file):
+        os.remove(file)
+    logger.info(f"Reused stored asset {asset.public_id} for identical upload")
+    return {
+        'secure_url': asset.secure_url,
+        'public_id': asset.public_id,
+        'resource_type': asset.resource_type,
+        'bytes': asset.size,
+        'existing': True,
+        'reused': True,
+    }
+
+
+def upload_file(storage, file, folder, sha256):
+    size = get_file_size(file)
+    result = storage.upload(file, folder)
+    result.setdefault('bytes', size)
+    result['sha256'] = sha256
+    return result
+
+
+def record_assets(results):
+    """
+    Register the files of a successful batch as MediaAssets and count the
+    reuses. Files the storage already had (existing) are registered as well,
+    and a row left by an earlier upload of the same content is updated.
+    """
+    MediaAsset = apps.get_model('api', 'MediaAsset')
+    for result in results.values():
+        if result.get('reused'):
+            MediaAsset.objects.filter(sha256=result['sha256']).update(
+                reuse_count=F('reuse_count') + 1,
+                bytes_saved=F('bytes_saved') + (result.get('bytes') or 0),
+            )
+            continue
+        MediaAsset.objects.update_or_create(
+            sha256=result['sha256'],
+            defaults={
+                'secure_url': result['secure_url'],
+                'public_id': result['public_id'],
+                'resource_type': result.get('resource_type') or 'image',
+                'size': result.get('bytes') or 0,
+            },
+        )
+
+
+def destroy_asset(storage, public_id, resource_type=None):
+    """Delete a stored file, and its MediaAsset so the file is never reused."""
+    storage.destroy(public_id, resource_type=resource_type)
+    apps.get_model('api', 'MediaAsset').objects.filter(public_id=public_id).delete()
+
+
+def upload_files(files, hashes=None):
+    """
+    Uploads several files concurrently to the configured storage, all or nothing.
+
+    Files whose content is already stored (looked up by SHA-256 in MediaAsset)
+    are not uploaded again; their existing URL is returned instead.
+
+    Args:
+        files (dict): Maps a key (usually the model field name) to a
+            (file, folder) tuple, where file is a local path or an uploaded file.
+        hashes (dict): Optional SHA-256 per key, when already computed while
+            the file was received. Missing hashes are computed here.
+
+    Returns:
+        dict: The upload result for each key.
+
+    Raises:
+        BatchUploadError: If any upload fails. Files that were uploaded by this
+            batch are destroyed again before raising, so no orphaned assets are
+            left behind. Reused assets are shared and left alone.
+    """
+    if not files:
+        return {}
+
+    hashes = hashes or {}
+    storage = get_storage()
+    results, errors, pending = {}, {}, {}
+    # Deduplicate in this thread, so the upload threads never touch the database.
+    for key, (file, folder) in files.items():
+        sha256 = hashes.get(key) or hash_file(file)
+        reused = reuse_asset(storage, file, sha256)
+        if reused is None:
+            pending[key] = (file, folder, sha256)
+        else:
+            results[key] = {**reused, 'sha256': sha256}
+
+    with ThreadPoolExecutor(max_workers=max(len(pending), 1)) as executor:
+        futures = {
+            key: executor.submit(upload_file, storage, file, folder, sha256)
+            for key, (file, folder, sha256) in pending.items()
+        }
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception as error:
+                errors[key] = str(error)
+
+    if errors:
+        for key, result in results.items():
+            if result.get('existing'):
+                continue
+            try:
+                destroy_asset(storage, result['public_id'], resource_type=result.get('resource_type'))
+                logger.info(f"Rolled back upload: {result['public_id']}")
+            except Exception as error:
+                logger.error(f"Error rolling back upload {result.get('public_id')}: {error}")
+        raise BatchUploadError(errors)
+
+    record_assets(results)
+    return results
+
+
+def dedup_report():
+    """Totals of the MediaAsset table: what is stored and what reuse saved."""
+    MediaAsset = apps.get_model('api', 'MediaAsset')
+    return MediaAsset.objects.aggregate(
+        assets=Count('id'),
+        stored_bytes=Coalesce(Sum('size'), 0),
+        reuses=Coalesce(Sum('reuse_count'), 0),
+        bytes_saved=Coalesce(Sum('bytes_saved'), 0),
+    )
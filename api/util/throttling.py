@@ -0,0 +1,142 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.throttling import BaseThrottle
+
+
+def take_token(state, capacity, refill_rate, now):
+    """
+    Token bucket step. state is (tokens, updated_at) or None for a full
+    bucket. Returns the new state and 0.0 if a token was taken, or the
+    refilled state and the seconds until a token is available.
+    """
+    if state is None:
+        tokens = capacity
+    else:
+        tokens, updated_at = state
+        tokens = min(capacity, tokens + (now - updated_at) * refill_rate)
+    if tokens >= 1:
+        return (tokens - 1, now), 0.0
+    return (tokens, now), (1 - tokens) / refill_rate
+
+
+class LocalBucketStore:
+    """In-process buckets, bounded to the most recently seen max_entries keys."""
+
+    def __init__(self, max_entries):
+        self._lock = threading.Lock()
+        self._buckets = OrderedDict()
+        self.max_entries = max_entries
+
+    def consume(self, key, capacity, refill_rate, now):
+        with self._lock:
+            state, wait = take_token(self._buckets.get(key), capacity, refill_rate, now)
+            self._buckets[key] = state
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_entries:
+                self._buckets.popitem(last=False)
+        return wait
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+class SharedBucketStore:
+    """
+    Buckets in a Django cache, shared by all workers. The read-modify-write
+    isn't atomic, so concurrent requests may occasionally both get the last
+    token; the local buckets still bound what a single worker lets through.
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def consume(self, key, capacity, refill_rate, now):
+        cache_key = f'api:throttle:{key}'
+        state, wait = take_token(self.cache.get(cache_key), capacity, refill_rate, now)
+        if not wait:
+            # A bucket left alone for this long is full again, same as missing.
+            self.cache.set(cache_key, state, timeout=int(capacity / refill_rate) + 1)
+        return wait
+
+
+# scope -> LocalBucketStore, shared by all throttle instances of the worker
+local_stores = {}
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Token bucket per client IP, plus one per submitted email address.
+
+    The IP bucket always applies; the client IP comes from REMOTE_ADDR, or
+    from X-Forwarded-For as far as REST_FRAMEWORK['NUM_PROXIES'] trusted
+    proxies vouch for it, so it can't be changed per request. The email
+    bucket limits a single address across IPs; it needs the email from
+    request.data, so it is only consulted once the IP bucket let the request
+    through, and only then is the body parsed (a client over its IP limit is
+    rejected unparsed). Each key may make API_RATE_LIMIT[scope]['BURST']
+    requests at once and regains PER_HOUR of them per hour. Buckets live in
+    this worker and, when API_RATE_LIMIT['SHARED_CACHE_ALIAS'] is set, in that
+    cache as well, so the limit holds across workers. Runs in
+    APIView.initial(), before the handler's transaction, validation or any
+    query.
+    """
+    scope = None
+
+    def __init__(self):
+        config = getattr(settings, 'API_RATE_LIMIT', {})
+        scope_config = config.get(self.scope, {})
+        self.enabled = config.get('ENABLED', True)
+        self.capacity = scope_config.get('BURST', 5)
+        self.refill_rate = scope_config.get('PER_HOUR', 20) / 3600
+        self.wait_seconds = None
+
+        if self.scope not in local_stores:
+            local_stores[self.scope] = LocalBucketStore(config.get('LOCAL_MAX_ENTRIES', 10000))
+        self.local = local_stores[self.scope]
+        alias = config.get('SHARED_CACHE_ALIAS')
+        self.shared = SharedBucketStore(caches[alias]) if alias else None
+
+    def get_ip_key(self, request):
+        return f'{self.scope}:ip:{self.get_ident(request)}'
+
+    def get_email_key(self, request):
+        # Parses the body; the view reuses the parsed request.data.
+        email = request.data.get('email') if hasattr(request.data, 'get') else None
+        if isinstance(email, str) and email.strip():
+            return f'{self.scope}:email:{email.strip().lower()}'
+        return None
+
+    def consume(self, key, now):
+        wait = self.local.consume(key, self.capacity, self.refill_rate, now)
+        if not wait and self.shared is not None:
+            wait = self.shared.consume(key, self.capacity, self.refill_rate, now)
+        return wait
+
+    def allow_request(self, request, view):
+        if not self.enabled:
+            return True
+
+        now = time.time()
+        wait = self.consume(self.get_ip_key(request), now)
+        if not wait:
+            email_key = self.get_email_key(request)
+            if email_key is not None:
+                wait = self.consume(email_key, now)
+
+        if wait:
+            self.wait_seconds = wait
+            return False
+        return True
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class ContactRateThrottle(TokenBucketThrottle):
+    """Limits contact form submissions (ContactView.post)."""
+    scope = 'CONTACT'
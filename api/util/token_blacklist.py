@@ -0,0 +1,108 @@
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+# Rows blacklisted this long before the last refresh are read again, so a
+# transaction that committed late (with an older blacklisted_at) isn't missed.
+REFRESH_OVERLAP = timedelta(seconds=5)
+
+
+class BlacklistIndex:
+    """
+    Per-worker index of blacklisted refresh token jtis.
+
+    Loaded in full on first use, then kept current by re-reading only the
+    rows blacklisted since the previous refresh, at most once every
+    API_AUTH['BLACKLIST_REFRESH_SECONDS']. Tokens blacklisted by this worker
+    are added immediately. A jti that isn't in the index is known not to be
+    blacklisted (up to the refresh interval for other workers' logouts)
+    without a query.
+
+    Expired tokens are dropped from the index on every refresh. Their rows
+    are deleted by simplejwt's `manage.py flushexpiredtokens`, run from cron
+    or another scheduler, so neither grows without bound.
+
+    Only LogoutView checks refresh tokens: the API has no token refresh or
+    verify endpoint.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # jti -> expiry (epoch seconds)
+        self._expiries = {}
+        self._refreshed_at = None
+        # None until the first load
+        self._refreshed_monotonic = None
+        self._stats = {
+            'lookups': 0,
+            'refreshes': 0,
+        }
+
+    @property
+    def config(self):
+        return getattr(settings, 'API_AUTH', {})
+
+    def refresh(self):
+        now = timezone.now()
+        queryset = BlacklistedToken.objects.filter(token__expires_at__gt=now)
+        if self._refreshed_at is not None:
+            queryset = queryset.filter(blacklisted_at__gte=self._refreshed_at - REFRESH_OVERLAP)
+        rows = queryset.values_list('token__jti', 'token__expires_at')
+
+        cutoff = now.timestamp()
+        with self._lock:
+            self._expiries = {jti: exp for jti, exp in self._expiries.items() if exp > cutoff}
+            for jti, expires_at in rows:
+                self._expiries[jti] = expires_at.timestamp()
+            self._refreshed_at = now
+            self._refreshed_monotonic = time.monotonic()
+            self._stats['refreshes'] += 1
+
+    def contains(self, jti):
+        if (
+            self._refreshed_monotonic is None
+            or time.monotonic() - self._refreshed_monotonic >= self.config.get('BLACKLIST_REFRESH_SECONDS', 30)
+        ):
+            self.refresh()
+        with self._lock:
+            self._stats['lookups'] += 1
+            return jti in self._expiries
+
+    def add(self, jti, exp):
+        with self._lock:
+            self._expiries[jti] = exp
+
+    def invalidate(self):
+        """Reload in full on the next lookup (after rows were deleted)."""
+        with self._lock:
+            self._expiries = {}
+            self._refreshed_at = None
+            self._refreshed_monotonic = None
+
+    def stats(self):
+        with self._lock:
+            return {**self._stats, 'entries': len(self._expiries)}
+
+
+blacklist_index = BlacklistIndex()
+
+
+class IndexedRefreshToken(RefreshToken):
+    """RefreshToken whose blacklist check is answered by blacklist_index."""
+
+    def check_blacklist(self):
+        if blacklist_index.contains(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        blacklisted = super().blacklist()
+        blacklist_index.add(self.payload[api_settings.JTI_CLAIM], self.payload['exp'])
+        return blacklisted
@@ -0,0 +1,130 @@
+import base64
+import binascii
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+
+from django.conf import settings
+from rest_framework_simplejwt.settings import api_settings
+
+
+class TokenCache:
+    """
+    Per-worker TTL cache of verified access tokens.
+
+    Maps a raw token (the exact bytes from the Authorization header, so a hit
+    is always the very token that was verified) to its validated token and a
+    snapshot of the user it was issued to. A hit skips the signature check and
+    the user query. Entries expire after API_AUTH['TOKEN_CACHE_TTL'] seconds
+    or when the token itself expires, whichever comes first; they are evicted
+    by jti on logout (see LogoutView) and by user id when the user is saved
+    or deleted (see api/signals.py). Other workers pick such changes up
+    within the TTL.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # raw token -> (expires_at, jti, user_id, validated_token, user)
+        self._entries = OrderedDict()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expired_rejections': 0,
+        }
+
+    @property
+    def config(self):
+        return getattr(settings, 'API_AUTH', {})
+
+    @property
+    def enabled(self):
+        return self.config.get('TOKEN_CACHE_ENABLED', True)
+
+    def get(self, raw_token):
+        """(user, validated_token) for a cached token, or None."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(raw_token)
+            if entry is None or entry[0] <= time.time():
+                if entry is not None:
+                    del self._entries[raw_token]
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(raw_token)
+            self._stats['hits'] += 1
+
+        # A copy per request, so nothing a view sets on the user leaks into
+        # other requests.
+        return copy.copy(entry[4]), entry[3]
+
+    def is_expired(self, raw_token):
+        """
+        True if the unverified exp claim of raw_token is past (beyond the
+        LEEWAY simplejwt allows). Such a token fails validation whatever its
+        signature, so it can be turned away without any verification work.
+        Malformed tokens return False and are left to the full validation.
+        """
+        try:
+            payload = raw_token.split(b'.')[1]
+            claims = json.loads(base64.urlsafe_b64decode(payload + b'=' * (-len(payload) % 4)))
+            exp = float(claims['exp'])
+        except (IndexError, binascii.Error, ValueError, TypeError, KeyError):
+            return False
+
+        leeway = api_settings.LEEWAY
+        if isinstance(leeway, timedelta):
+            leeway = leeway.total_seconds()
+        if exp + leeway >= time.time():
+            return False
+
+        with self._lock:
+            self._stats['expired_rejections'] += 1
+        return True
+
+    def set(self, raw_token, validated_token, user):
+        if not self.enabled:
+            return
+
+        expires_at = min(validated_token['exp'], time.time() + self.config.get('TOKEN_CACHE_TTL', 60))
+        entry = (
+            expires_at,
+            validated_token.get(api_settings.JTI_CLAIM),
+            str(user.pk),
+            validated_token,
+            copy.copy(user),
+        )
+        max_entries = self.config.get('TOKEN_CACHE_MAX_ENTRIES', 1024)
+        with self._lock:
+            self._entries[raw_token] = entry
+            self._entries.move_to_end(raw_token)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def evict(self, jti=None, user_id=None):
+        """Drop the entries of a token (by jti) or of every token of a user."""
+        with self._lock:
+            stale = [
+                raw_token for raw_token, entry in self._entries.items()
+                if (jti is not None and entry[1] == jti)
+                or (user_id is not None and entry[2] == str(user_id))
+            ]
+            for raw_token in stale:
+                del self._entries[raw_token]
+            self._stats['evictions'] += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {**self._stats, 'entries': len(self._entries)}
+
+
+token_cache = TokenCache()
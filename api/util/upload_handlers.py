@@ -0,0 +1,116 @@
+import hashlib
+import os
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from api.util.responses import APIResponse
+from api.util.upload_jobs import new_spool_path
+
+
+def get_streaming_config():
+    return getattr(settings, 'UPLOAD_STREAMING', {})
+
+
+class UploadTooLarge(APIException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = 'Uploaded file is too large.'
+    default_code = 'UPLOAD_TOO_LARGE'
+    # Answered with the APIResponse envelope (see api_exception_handler)
+    return_code = APIResponse.Codes.UPLOAD_TOO_LARGE
+
+
+class SpooledUploadedFile(UploadedFile):
+    """
+    An uploaded file written straight into the upload spool directory.
+
+    The file is deleted when the request closes it, unless claim() handed it
+    over to an upload job first.
+    """
+
+    def __init__(self, path, name, content_type, charset, content_type_extra=None):
+        super().__init__(open(path, 'w+b'), name, content_type, 0, charset, content_type_extra)
+        self.path = path
+        self.claimed = False
+        # SHA-256 of the content, set by SpoolingUploadHandler once complete
+        self.sha256 = None
+
+    def temporary_file_path(self):
+        return self.path
+
+    def claim(self):
+        """Take ownership of the spooled file and return its path."""
+        self.claimed = True
+        self.file.close()
+        return self.path
+
+    def close(self):
+        try:
+            return self.file.close()
+        finally:
+            if not self.claimed and os.path.exists(self.path):
+                os.remove(self.path)
+
+
+class SpoolingUploadHandler(FileUploadHandler):
+    """
+    Streams multipart file data to the upload spool in UPLOAD_STREAMING['CHUNK_SIZE']
+    pieces, so no more than one chunk of a file is ever held in memory.
+
+    The content is hashed as it streams by, so deduplication against stored
+    MediaAssets never has to read the file again.
+
+    Oversized uploads are rejected with a 413 as early as possible: from the
+    Content-Length before any of the body is read, and otherwise as soon as a
+    file grows past MAX_FILE_SIZE. The files of a rejected request, including
+    those already complete, are removed from the spool.
+    """
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        config = get_streaming_config()
+        self.chunk_size = config.get('CHUNK_SIZE', 64 * 1024)
+        self.max_file_size = config.get('MAX_FILE_SIZE', 20 * 1024 * 1024)
+        self.max_request_size = config.get('MAX_REQUEST_SIZE', 50 * 1024 * 1024)
+        # Files of this request received in full so far
+        self.completed = []
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        if content_length and content_length > self.max_request_size:
+            raise UploadTooLarge()
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.file = SpooledUploadedFile(
+            new_spool_path(self.file_name), self.file_name, self.content_type,
+            self.charset, self.content_type_extra
+        )
+        self.digest = hashlib.sha256()
+
+    def receive_data_chunk(self, raw_data, start):
+        if start + len(raw_data) > self.max_file_size:
+            self.discard()
+            raise UploadTooLarge()
+        self.file.write(raw_data)
+        self.digest.update(raw_data)
+
+    def file_complete(self, file_size):
+        self.file.seek(0)
+        self.file.size = file_size
+        self.file.sha256 = self.digest.hexdigest()
+        self.completed.append(self.file)
+        return self.file
+
+    def discard(self):
+        """Remove every spooled file of the request (none is claimed yet)."""
+        for spooled in self.completed:
+            spooled.close()
+        if hasattr(self, 'file'):
+            self.file.close()
+
+    def upload_interrupted(self):
+        if hasattr(self, 'file'):
+            self.file.close()
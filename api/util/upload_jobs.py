@@ -0,0 +1,229 @@
+import hashlib
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from api.util.image_variants import (
+    build_variant_map, get_variant_field, render_job_variants, variant_key,
+)
+from api.util.storage import upload_files
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_config():
+    return getattr(settings, 'UPLOAD_JOBS', {})
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=get_config().get('MAX_WORKERS', 2),
+                thread_name_prefix='upload-job',
+            )
+            expire_stale_jobs()
+        return _executor
+
+
+def expire_stale_jobs():
+    """
+    Mark jobs that have been PENDING or RUNNING for longer than
+    UPLOAD_JOBS['STALE_AFTER_SECONDS'] as FAILED. Jobs run in the worker
+    process that accepted the request, so a job that was queued or running
+    when its worker exited is lost; nothing re-queues it. Runs when a worker
+    starts its executor.
+    """
+    UploadJob = apps.get_model('api', 'UploadJob')
+    cutoff = timezone.now() - timedelta(seconds=get_config().get('STALE_AFTER_SECONDS', 60 * 60))
+    stale = UploadJob.objects.filter(status__in=['PENDING', 'RUNNING'], modified_at__lt=cutoff)
+    for job in stale:
+        logger.warning(f"Upload job {job.pk} expired in status {job.status}")
+        discard_spooled(job.files)
+        job.status = 'FAILED'
+        job.error = "The upload was interrupted (worker exited) and has to be repeated."
+        job.save(update_fields=['status', 'error', 'modified_at'])
+
+
+def new_spool_path(file_name):
+    """A fresh path in the spool directory, keeping the file's extension."""
+    spool_dir = get_config().get('SPOOL_DIR')
+    os.makedirs(spool_dir, exist_ok=True)
+    extension = os.path.splitext(file_name or '')[1][:10]
+    return os.path.join(spool_dir, f"{uuid.uuid4().hex}{extension}")
+
+
+def spool_file(uploaded_file):
+    """
+    Move an uploaded file into the spool directory.
+    Returns its path and the SHA-256 of its content.
+    """
+    # Files streamed by SpoolingUploadHandler are already in the spool, and hashed.
+    if hasattr(uploaded_file, 'claim'):
+        return uploaded_file.claim(), uploaded_file.sha256
+
+    path = new_spool_path(uploaded_file.name)
+    digest = hashlib.sha256()
+    with open(path, 'wb') as destination:
+        for chunk in uploaded_file.chunks():
+            destination.write(chunk)
+            digest.update(chunk)
+    return path, digest.hexdigest()
+
+
+def discard_spooled(spooled):
+    for entry in spooled.values():
+        if os.path.exists(entry['path']):
+            os.remove(entry['path'])
+
+
+@contextmanager
+def spooled_transaction(spooled):
+    """
+    transaction.atomic() for a write request with spooled files. If the
+    transaction doesn't commit (an exception in the block or in the commit),
+    no job will ever pick the files up, so they are discarded.
+    """
+    try:
+        with transaction.atomic():
+            yield
+    except BaseException:
+        discard_spooled(spooled)
+        raise
+
+
+def prepare_uploads(data, files, upload_fields):
+    """
+    Handle the file fields of a write request.
+
+    upload_fields maps each file field to its storage folder. In synchronous
+    mode (UPLOAD_JOBS['ASYNC'] = False) the files are uploaded right away and
+    their URLs put into data, and an empty dict is returned. Otherwise the files
+    are spooled to disk, removed from data, and the spooled entries are returned
+    for schedule_upload_job().
+    """
+    present = {field: folder for field, folder in upload_fields.items() if field in files}
+
+    if not get_config().get('ASYNC', True):
+        results = upload_files(
+            {field: (files[field], folder) for field, folder in present.items()},
+            hashes={field: getattr(files[field], 'sha256', None) for field in present},
+        )
+        for field, upload_result in results.items():
+            data[field] = upload_result.get('secure_url')
+        return {}
+
+    spooled = {}
+    for field, folder in present.items():
+        path, sha256 = spool_file(files[field])
+        spooled[field] = {'path': path, 'folder': folder, 'sha256': sha256}
+        data.pop(field, None)
+    return spooled
+
+
+def schedule_upload_job(instance, spooled):
+    """
+    Record an UploadJob for the spooled files of instance and queue it once the
+    surrounding transaction commits. Returns None when there is nothing to upload.
+    """
+    if not spooled:
+        return None
+
+    UploadJob = apps.get_model('api', 'UploadJob')
+    job = UploadJob.objects.create(
+        model_label=instance._meta.label,
+        object_id=instance.pk,
+        files=spooled,
+    )
+    transaction.on_commit(lambda: get_executor().submit(run_upload_job, job.pk))
+    return job
+
+
+def get_superseded_fields(job, model):
+    """
+    Fields of the job's object that a newer job, unless it failed, uploads as
+    well (including their variant fields). The newer upload wins for them,
+    whichever job finishes last.
+    """
+    UploadJob = apps.get_model('api', 'UploadJob')
+    newer = UploadJob.objects.filter(
+        model_label=job.model_label, object_id=job.object_id, created_at__gt=job.created_at,
+    ).exclude(status='FAILED').values_list('files', flat=True)
+    fields = set()
+    for files in newer:
+        for field in files:
+            fields.update((field, get_variant_field(model, field)))
+    return fields
+
+
+def run_upload_job(job_id):
+    """Upload the files of a job and patch the target object's URL fields."""
+    UploadJob = apps.get_model('api', 'UploadJob')
+    close_old_connections()
+    job = UploadJob.objects.get(pk=job_id)
+    variants = {}
+    try:
+        job.status = 'RUNNING'
+        job.save(update_fields=['status', 'modified_at'])
+
+        model = apps.get_model(job.model_label)
+        instance = model.objects.get(pk=job.object_id)
+
+        # Resized copies of the images are rendered before the originals
+        # are uploaded (and their spooled files removed).
+        variants = render_job_variants(model, job.files)
+        files = {field: (entry['path'], entry['folder']) for field, entry in job.files.items()}
+        for field, rendered in variants.items():
+            for image_format, width, path in rendered:
+                files[variant_key(field, image_format, width)] = (path, f"{job.files[field]['folder']}/variants")
+
+        # All files of the job are uploaded concurrently, all or nothing.
+        uploads = upload_files(
+            files,
+            hashes={field: entry.get('sha256') for field, entry in job.files.items()},
+        )
+        result = {field: uploads[field].get('secure_url') for field in job.files}
+        for field, rendered in variants.items():
+            result[get_variant_field(model, field)] = build_variant_map(field, rendered, uploads)
+
+        superseded = get_superseded_fields(job, model)
+        applied = {field: url for field, url in result.items() if field not in superseded}
+        if len(applied) < len(result):
+            logger.info(f"Upload job {job.pk}: newer uploads win for {sorted(set(result) - set(applied))}")
+        for field, url in applied.items():
+            setattr(instance, field, url)
+        if applied:
+            # save() rather than update() so post_save invalidates cached payloads;
+            # modified_at moves the object's ETag/Last-Modified along.
+            instance.save(update_fields=list(applied) + ['modified_at'])
+
+        job.result = result
+        job.status = 'SUCCEEDED'
+        job.save(update_fields=['result', 'status', 'modified_at'])
+        logger.info(f"Upload job {job.pk} finished for {job.model_label} {job.object_id}")
+
+    except Exception as error:
+        logger.error(f"Upload job {job.pk} failed: {error}")
+        job.status = 'FAILED'
+        job.error = str(error)
+        job.save(update_fields=['status', 'error', 'modified_at'])
+
+    finally:
+        discard_spooled(job.files)
+        discard_spooled({
+            path: {'path': path} for rendered in variants.values() for _, _, path in rendered
+        })
+        close_old_connections()
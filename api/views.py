@@ -1,24 +1,89 @@
+import copy
+import math
+import mimetypes
+import os
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils._os import safe_join
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import permissions, status
+from rest_framework.exceptions import Throttled
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from rest_framework_simplejwt.views import TokenObtainPairView
 from django.db import transaction
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.settings import api_settings
 from .util.responses import APIResponse
+from .util.base_serializer import serialize_list
 
 
 from .serializers import CustomTokenObtainPairSerializer
 from .models import (
-    Profile, Skill, Experience, Project, Certification, Education, Contact,ContactInfo
+    Profile, Skill, Experience, Project, Certification, Education, Contact,ContactInfo,
+    UploadJob
 )
 from .serializers import (
     ProfileSerializer, SkillSerializer, ExperienceSerializer,
     ProjectSerializer, CertificationSerializer, EducationSerializer, 
-    ContactSerializer,ContactInfoSerializer
+    ContactSerializer,ContactInfoSerializer, UploadJobSerializer
 )
-from .util.cloudinary_util import upload_to_cloudinary
+from .util.storage import dedup_report
+from .util.upload_jobs import discard_spooled, prepare_uploads, schedule_upload_job, spooled_transaction
+from .util.cache_util import payload_cache
+from .util.db_metrics import get_pool_stats
+from .util.throttling import ContactRateThrottle
+from .util.token_blacklist import IndexedRefreshToken, blacklist_index
+from .util.token_cache import token_cache
+from .util.conditional import aget_validators, conditional_get, combine_validators, get_validators
+from .util.pagination import KeysetPaginator
+from .util.async_reads import aget_list_data
+from .util.response_cache import cached_response
+from .util.query_params import DEFAULT_ORDERING, InvalidQueryParam, ListQuery
+
+
+def get_list_data(model, serializer_class, request=None, filter_fields=(),
+                  ordering_fields=(), paginate=False):
+    """
+    Serialized list payload for a model, served from the payload cache.
+
+    With a request, the allowed filter/fields/ordering query params are
+    applied (see ListQuery), and a keyset-paginated page is returned when
+    `paginate` is set or the client sent ?cursor= / ?page_size=.
+    Raises InvalidQueryParam for bad parameters.
+    """
+    if request is None:
+        return payload_cache.get_or_set(
+            model, 'list',
+            lambda: serialize_list(
+                model.objects.all().order_by(*DEFAULT_ORDERING), serializer_class
+            )
+        )
+
+    query = ListQuery(request, model, filter_fields, ordering_fields)
+    serializer_class = query.get_serializer_class(serializer_class)
+    queryset = query.apply(model.objects.all())
+
+    if paginate or KeysetPaginator.is_requested(request):
+        if query.ordering != DEFAULT_ORDERING:
+            raise InvalidQueryParam('ordering')
+        paginator = KeysetPaginator(request)
+        variant = query.cache_variant and paginator.cache_variant and (
+            f'{query.cache_variant}:{paginator.cache_variant}'
+        )
+        build = lambda: paginator.get_page_data(queryset, serializer_class)
+    else:
+        variant = query.cache_variant
+        build = lambda: serialize_list(queryset, serializer_class)
+
+    # Variants outside the cached set (see ListQuery.cache_variant) are built each time.
+    if variant is None:
+        return build()
+    return payload_cache.get_or_set(model, variant, build)
+
+
 # ==================== Authentication ====================
 # class LoginView(TokenObtainPairView):
 #     """Custom JWT login view"""
@@ -54,8 +119,10 @@ class LogoutView(APIView):
     def post(self, request):
         try:
             refresh_token = request.data["refresh"]
-            token = RefreshToken(refresh_token)
+            token = IndexedRefreshToken(refresh_token)
             token.blacklist()
+            # The access token of this request no longer comes from the cache.
+            token_cache.evict(jti=request.auth.get(api_settings.JTI_CLAIM))
             
             return APIResponse.get_success_response(
                 APIResponse.Codes.LOGOUT_SUCCESS, 
@@ -73,74 +140,91 @@ class LogoutView(APIView):
 class ProfileView(APIView):
     parser_classes = [MultiPartParser, FormParser, JSONParser]
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    # Read by the async GET path (see api/util/async_reads.py)
+    model = Profile
+    serializer_class = ProfileSerializer
+    retrieved_code = APIResponse.Codes.PROFILE_RETRIEVED
+    # file field -> storage folder
+    upload_fields = {'profile_picture': 'profile_pictures', 'resume': 'resumes'}
+    filter_fields = ()
+    ordering_fields = ()
 
     def get_object(self, pk):
         return get_object_or_404(Profile, pk=pk)
 
+    @conditional_get(Profile)
+    @cached_response(Profile)
     def get(self, request, pk=None):
         if pk:
             profile = self.get_object(pk)
-            serializer = ProfileSerializer(profile)
+            data = ProfileSerializer(profile).data
         else:
-            profiles = Profile.objects.all().order_by('-created_at', '-id') 
-            serializer = ProfileSerializer(profiles, many=True)
+            try:
+                data = get_list_data(
+                    Profile, ProfileSerializer, request,
+                    self.filter_fields, self.ordering_fields
+                )
+            except InvalidQueryParam as exc:
+                return APIResponse.get_error_response(exc.return_code)
         
         return APIResponse.get_success_response(
             APIResponse.Codes.PROFILE_RETRIEVED, 
-            serializer.data
+            data
         )
 
-    @transaction.atomic
     def post(self, request):
-        data = request.data.copy() # Make mutable copy
-
-        # Handle file uploads manually
-        if 'profile_picture' in request.FILES:
-            upload_result = upload_to_cloudinary(request.FILES['profile_picture'], folder="profile_pictures")
-            data['profile_picture'] = upload_result.get('secure_url')
-        
-        if 'resume' in request.FILES:
-            upload_result = upload_to_cloudinary(request.FILES['resume'], folder="resumes")
-            data['resume'] = upload_result.get('secure_url')
-
-        serializer = ProfileSerializer(data=data)
-        if serializer.is_valid():
-            serializer.save()
-            return APIResponse.get_success_response(
-                APIResponse.Codes.PROFILE_CREATED, 
-                serializer.data,
-                status.HTTP_201_CREATED
+        data = copy.copy(request.data)  # Mutable copy; the uploaded files are shared, not copied
+
+        # Files are uploaded by a background job (see UPLOAD_JOBS)
+        spooled = prepare_uploads(data, request.FILES, self.upload_fields)
+        with spooled_transaction(spooled):
+            serializer = ProfileSerializer(data=data)
+            if serializer.is_valid():
+                profile = serializer.save()
+                job = schedule_upload_job(profile, spooled)
+                if job:
+                    return APIResponse.get_success_response(
+                        APIResponse.Codes.PROFILE_CREATED,
+                        {**serializer.data, 'upload_job': UploadJobSerializer(job).data},
+                        status.HTTP_202_ACCEPTED
+                    )
+                return APIResponse.get_success_response(
+                    APIResponse.Codes.PROFILE_CREATED, 
+                    serializer.data,
+                    status.HTTP_201_CREATED
+                )
+            discard_spooled(spooled)
+            return APIResponse.get_validation_error_response(
+                APIResponse.Codes.VALIDATION_ERROR, 
+                serializer.errors
             )
-        return APIResponse.get_serializer_error_response(
-            APIResponse.Codes.VALIDATION_ERROR, 
-            serializer.errors
-        )
 
-    @transaction.atomic
     def put(self, request, pk):
         profile = self.get_object(pk)
-        data = request.data.copy() # Make mutable copy
-
-        # Handle file uploads manually
-        if 'profile_picture' in request.FILES:
-            upload_result = upload_to_cloudinary(request.FILES['profile_picture'], folder="profile_pictures")
-            data['profile_picture'] = upload_result.get('secure_url')
-        
-        if 'resume' in request.FILES:
-            upload_result = upload_to_cloudinary(request.FILES['resume'], folder="resumes")
-            data['resume'] = upload_result.get('secure_url')
-
-        serializer = ProfileSerializer(profile, data=data, partial=True)
-        if serializer.is_valid():
-            serializer.save()
-            return APIResponse.get_success_response(
-                APIResponse.Codes.PROFILE_UPDATED, 
-                serializer.data
+        data = copy.copy(request.data)  # Mutable copy; the uploaded files are shared, not copied
+
+        # Files are uploaded by a background job (see UPLOAD_JOBS)
+        spooled = prepare_uploads(data, request.FILES, self.upload_fields)
+        with spooled_transaction(spooled):
+            serializer = ProfileSerializer(profile, data=data, partial=True)
+            if serializer.is_valid():
+                profile = serializer.save()
+                job = schedule_upload_job(profile, spooled)
+                if job:
+                    return APIResponse.get_success_response(
+                        APIResponse.Codes.PROFILE_UPDATED,
+                        {**serializer.data, 'upload_job': UploadJobSerializer(job).data},
+                        status.HTTP_202_ACCEPTED
+                    )
+                return APIResponse.get_success_response(
+                    APIResponse.Codes.PROFILE_UPDATED, 
+                    serializer.data
+                )
+            discard_spooled(spooled)
+            return APIResponse.get_validation_error_response(
+                APIResponse.Codes.VALIDATION_ERROR, 
+                serializer.errors
             )
-        return APIResponse.get_serializer_error_response(
-            APIResponse.Codes.VALIDATION_ERROR, 
-            serializer.errors
-        )
 
     @transaction.atomic
     def delete(self, request, pk):
@@ -153,21 +237,33 @@ class ProfileView(APIView):
 class SkillView(APIView):
     parser_classes = [MultiPartParser, FormParser, JSONParser]
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    model = Skill
+    serializer_class = SkillSerializer
+    retrieved_code = APIResponse.Codes.SKILL_RETRIEVED
+    filter_fields = ('category',)
+    ordering_fields = ('name', 'percentage', 'category', 'created_at')
 
     def get_object(self, pk):
         return get_object_or_404(Skill, pk=pk)
 
+    @conditional_get(Skill)
+    @cached_response(Skill)
     def get(self, request, pk=None):
         if pk:
             skill = self.get_object(pk)
-            serializer = SkillSerializer(skill)
+            data = SkillSerializer(skill).data
         else:
-            skills = Skill.objects.all().order_by('-created_at', '-id') 
-            serializer = SkillSerializer(skills, many=True)
+            try:
+                data = get_list_data(
+                    Skill, SkillSerializer, request,
+                    self.filter_fields, self.ordering_fields
+                )
+            except InvalidQueryParam as exc:
+                return APIResponse.get_error_response(exc.return_code)
         
         return APIResponse.get_success_response(
             APIResponse.Codes.SKILL_RETRIEVED, 
-            serializer.data
+            data
         )
 
     @transaction.atomic
@@ -180,7 +276,7 @@ class SkillView(APIView):
                 serializer.data,
                 status.HTTP_201_CREATED
             )
-        return APIResponse.get_serializer_error_response(
+        return APIResponse.get_validation_error_response(
             APIResponse.Codes.VALIDATION_ERROR, 
             serializer.errors
         )
@@ -195,7 +291,7 @@ class SkillView(APIView):
                 APIResponse.Codes.SKILL_UPDATED, 
                 serializer.data
             )
-        return APIResponse.get_serializer_error_response(
+        return APIResponse.get_validation_error_response(
             APIResponse.Codes.VALIDATION_ERROR, 
             serializer.errors
         )
@@ -211,62 +307,88 @@ class SkillView(APIView):
 class ExperienceView(APIView):
     parser_classes = [MultiPartParser, FormParser, JSONParser]
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    model = Experience
+    serializer_class = ExperienceSerializer
+    retrieved_code = APIResponse.Codes.EXPERIENCE_RETRIEVED
+    # file field -> storage folder
+    upload_fields = {'logo': 'company_logos'}
+    filter_fields = ()
+    ordering_fields = ('start_date', 'end_date', 'created_at')
 
     def get_object(self, pk):
         return get_object_or_404(Experience, pk=pk)
 
+    @conditional_get(Experience)
+    @cached_response(Experience)
     def get(self, request, pk=None):
         if pk:
             experience = self.get_object(pk)
-            serializer = ExperienceSerializer(experience)
+            data = ExperienceSerializer(experience).data
         else:
-            experiences = Experience.objects.all().order_by('-created_at', '-id') 
-            serializer = ExperienceSerializer(experiences, many=True)
+            try:
+                data = get_list_data(
+                    Experience, ExperienceSerializer, request,
+                    self.filter_fields, self.ordering_fields
+                )
+            except InvalidQueryParam as exc:
+                return APIResponse.get_error_response(exc.return_code)
         
         return APIResponse.get_success_response(
             APIResponse.Codes.EXPERIENCE_RETRIEVED, 
-            serializer.data
+            data
         )
 
-    @transaction.atomic
     def post(self, request):
-        data = request.data.copy()
-        if 'logo' in request.FILES:
-            upload_result = upload_to_cloudinary(request.FILES['logo'], folder="company_logos")
-            data['logo'] = upload_result.get('secure_url')
-
-        serializer = ExperienceSerializer(data=data)
-        if serializer.is_valid():
-            serializer.save()
-            return APIResponse.get_success_response(
-                APIResponse.Codes.EXPERIENCE_CREATED, 
-                serializer.data,
-                status.HTTP_201_CREATED
+        data = copy.copy(request.data)
+        # Files are uploaded by a background job (see UPLOAD_JOBS)
+        spooled = prepare_uploads(data, request.FILES, self.upload_fields)
+        with spooled_transaction(spooled):
+            serializer = ExperienceSerializer(data=data)
+            if serializer.is_valid():
+                experience = serializer.save()
+                job = schedule_upload_job(experience, spooled)
+                if job:
+                    return APIResponse.get_success_response(
+                        APIResponse.Codes.EXPERIENCE_CREATED,
+                        {**serializer.data, 'upload_job': UploadJobSerializer(job).data},
+                        status.HTTP_202_ACCEPTED
+                    )
+                return APIResponse.get_success_response(
+                    APIResponse.Codes.EXPERIENCE_CREATED, 
+                    serializer.data,
+                    status.HTTP_201_CREATED
+                )
+            discard_spooled(spooled)
+            return APIResponse.get_validation_error_response(
+                APIResponse.Codes.VALIDATION_ERROR, 
+                serializer.errors
             )
-        return APIResponse.get_serializer_error_response(
-            APIResponse.Codes.VALIDATION_ERROR, 
-            serializer.errors
-        )
 
-    @transaction.atomic
     def put(self, request, pk):
         experience = self.get_object(pk)
-        data = request.data.copy()
-        if 'logo' in request.FILES:
-            upload_result = upload_to_cloudinary(request.FILES['logo'], folder="company_logos")
-            data['logo'] = upload_result.get('secure_url')
-
-        serializer = ExperienceSerializer(experience, data=data, partial=True)
-        if serializer.is_valid():
-            serializer.save()
-            return APIResponse.get_success_response(
-                APIResponse.Codes.EXPERIENCE_UPDATED, 
-                serializer.data
+        data = copy.copy(request.data)
+        # Files are uploaded by a background job (see UPLOAD_JOBS)
+        spooled = prepare_uploads(data, request.FILES, self.upload_fields)
+        with spooled_transaction(spooled):
+            serializer = ExperienceSerializer(experience, data=data, partial=True)
+            if serializer.is_valid():
+                experience = serializer.save()
+                job = schedule_upload_job(experience, spooled)
+                if job:
+                    return APIResponse.get_success_response(
+                        APIResponse.Codes.EXPERIENCE_UPDATED,
+                        {**serializer.data, 'upload_job': UploadJobSerializer(job).data},
+                        status.HTTP_202_ACCEPTED
+                    )
+                return APIResponse.get_success_response(
+                    APIResponse.Codes.EXPERIENCE_UPDATED, 
+                    serializer.data
+                )
+            discard_spooled(spooled)
+            return APIResponse.get_validation_error_response(
+                APIResponse.Codes.VALIDATION_ERROR, 
+                serializer.errors
             )
-        return APIResponse.get_serializer_error_response(
-            APIResponse.Codes.VALIDATION_ERROR, 
-            serializer.errors
-        )
 
     @transaction.atomic
     def delete(self, request, pk):
@@ -279,62 +401,88 @@ class ExperienceView(APIView):
 class ProjectView(APIView):
     parser_classes = [MultiPartParser, FormParser, JSONParser]
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    model = Project
+    serializer_class = ProjectSerializer
+    retrieved_code = APIResponse.Codes.PROJECT_RETRIEVED
+    # file field -> storage folder
+    upload_fields = {'image': 'project_images'}
+    filter_fields = ()
+    ordering_fields = ('title', 'created_at')
 
     def get_object(self, pk):
         return get_object_or_404(Project, pk=pk)
 
+    @conditional_get(Project)
+    @cached_response(Project)
     def get(self, request, pk=None):
         if pk:
             project = self.get_object(pk)
-            serializer = ProjectSerializer(project)
+            data = ProjectSerializer(project).data
         else:
-            projects = Project.objects.all().order_by('-created_at', '-id') 
-            serializer = ProjectSerializer(projects, many=True)
+            try:
+                data = get_list_data(
+                    Project, ProjectSerializer, request,
+                    self.filter_fields, self.ordering_fields
+                )
+            except InvalidQueryParam as exc:
+                return APIResponse.get_error_response(exc.return_code)
         
         return APIResponse.get_success_response(
             APIResponse.Codes.PROJECT_RETRIEVED, 
-            serializer.data
+            data
         )
 
-    @transaction.atomic
     def post(self, request):
-        data = request.data.copy()
-        if 'image' in request.FILES:
-            upload_result = upload_to_cloudinary(request.FILES['image'], folder="project_images")
-            data['image'] = upload_result.get('secure_url')
-
-        serializer = ProjectSerializer(data=data)
-        if serializer.is_valid():
-            serializer.save()
-            return APIResponse.get_success_response(
-                APIResponse.Codes.PROJECT_CREATED, 
-                serializer.data,
-                status.HTTP_201_CREATED
+        data = copy.copy(request.data)
+        # Files are uploaded by a background job (see UPLOAD_JOBS)
+        spooled = prepare_uploads(data, request.FILES, self.upload_fields)
+        with spooled_transaction(spooled):
+            serializer = ProjectSerializer(data=data)
+            if serializer.is_valid():
+                project = serializer.save()
+                job = schedule_upload_job(project, spooled)
+                if job:
+                    return APIResponse.get_success_response(
+                        APIResponse.Codes.PROJECT_CREATED,
+                        {**serializer.data, 'upload_job': UploadJobSerializer(job).data},
+                        status.HTTP_202_ACCEPTED
+                    )
+                return APIResponse.get_success_response(
+                    APIResponse.Codes.PROJECT_CREATED, 
+                    serializer.data,
+                    status.HTTP_201_CREATED
+                )
+            discard_spooled(spooled)
+            return APIResponse.get_validation_error_response(
+                APIResponse.Codes.VALIDATION_ERROR, 
+                serializer.errors
             )
-        return APIResponse.get_serializer_error_response(
-            APIResponse.Codes.VALIDATION_ERROR, 
-            serializer.errors
-        )
 
-    @transaction.atomic
     def put(self, request, pk):
         project = self.get_object(pk)
-        data = request.data.copy()
-        if 'image' in request.FILES:
-            upload_result = upload_to_cloudinary(request.FILES['image'], folder="project_images")
-            data['image'] = upload_result.get('secure_url')
-
-        serializer = ProjectSerializer(project, data=data, partial=True)
-        if serializer.is_valid():
-            serializer.save()
-            return APIResponse.get_success_response(
-                APIResponse.Codes.PROJECT_UPDATED, 
-                serializer.data
+        data = copy.copy(request.data)
+        # Files are uploaded by a background job (see UPLOAD_JOBS)
+        spooled = prepare_uploads(data, request.FILES, self.upload_fields)
+        with spooled_transaction(spooled):
+            serializer = ProjectSerializer(project, data=data, partial=True)
+            if serializer.is_valid():
+                project = serializer.save()
+                job = schedule_upload_job(project, spooled)
+                if job:
+                    return APIResponse.get_success_response(
+                        APIResponse.Codes.PROJECT_UPDATED,
+                        {**serializer.data, 'upload_job': UploadJobSerializer(job).data},
+                        status.HTTP_202_ACCEPTED
+                    )
+                return APIResponse.get_success_response(
+                    APIResponse.Codes.PROJECT_UPDATED, 
+                    serializer.data
+                )
+            discard_spooled(spooled)
+            return APIResponse.get_validation_error_response(
+                APIResponse.Codes.VALIDATION_ERROR, 
+                serializer.errors
             )
-        return APIResponse.get_serializer_error_response(
-            APIResponse.Codes.VALIDATION_ERROR, 
-            serializer.errors
-        )
 
     @transaction.atomic
     def delete(self, request, pk):
@@ -347,70 +495,88 @@ class ProjectView(APIView):
 class CertificationView(APIView):
     parser_classes = [MultiPartParser, FormParser, JSONParser]
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    model = Certification
+    serializer_class = CertificationSerializer
+    retrieved_code = APIResponse.Codes.CERTIFICATION_RETRIEVED
+    # file field -> storage folder
+    upload_fields = {'image': 'cert_images', 'pdf_file': 'cert_pdfs'}
+    filter_fields = ()
+    ordering_fields = ('title', 'created_at')
 
     def get_object(self, pk):
         return get_object_or_404(Certification, pk=pk)
 
+    @conditional_get(Certification)
+    @cached_response(Certification)
     def get(self, request, pk=None):
         if pk:
             cert = self.get_object(pk)
-            serializer = CertificationSerializer(cert)
+            data = CertificationSerializer(cert).data
         else:
-            certs = Certification.objects.all().order_by('-created_at', '-id') 
-            serializer = CertificationSerializer(certs, many=True)
+            try:
+                data = get_list_data(
+                    Certification, CertificationSerializer, request,
+                    self.filter_fields, self.ordering_fields
+                )
+            except InvalidQueryParam as exc:
+                return APIResponse.get_error_response(exc.return_code)
         
         return APIResponse.get_success_response(
             APIResponse.Codes.CERTIFICATION_RETRIEVED, 
-            serializer.data
+            data
         )
 
-    @transaction.atomic
     def post(self, request):
-        data = request.data.copy()
-        if 'image' in request.FILES:
-            upload_result = upload_to_cloudinary(request.FILES['image'], folder="cert_images")
-            data['image'] = upload_result.get('secure_url')
-        
-        if 'pdf_file' in request.FILES:
-            upload_result = upload_to_cloudinary(request.FILES['pdf_file'], folder="cert_pdfs")
-            data['pdf_file'] = upload_result.get('secure_url')
-
-        serializer = CertificationSerializer(data=data)
-        if serializer.is_valid():
-            serializer.save()
-            return APIResponse.get_success_response(
-                APIResponse.Codes.CERTIFICATION_CREATED, 
-                serializer.data,
-                status.HTTP_201_CREATED
+        data = copy.copy(request.data)
+        # Files are uploaded by a background job (see UPLOAD_JOBS)
+        spooled = prepare_uploads(data, request.FILES, self.upload_fields)
+        with spooled_transaction(spooled):
+            serializer = CertificationSerializer(data=data)
+            if serializer.is_valid():
+                cert = serializer.save()
+                job = schedule_upload_job(cert, spooled)
+                if job:
+                    return APIResponse.get_success_response(
+                        APIResponse.Codes.CERTIFICATION_CREATED,
+                        {**serializer.data, 'upload_job': UploadJobSerializer(job).data},
+                        status.HTTP_202_ACCEPTED
+                    )
+                return APIResponse.get_success_response(
+                    APIResponse.Codes.CERTIFICATION_CREATED, 
+                    serializer.data,
+                    status.HTTP_201_CREATED
+                )
+            discard_spooled(spooled)
+            return APIResponse.get_validation_error_response(
+                APIResponse.Codes.VALIDATION_ERROR, 
+                serializer.errors
             )
-        return APIResponse.get_serializer_error_response(
-            APIResponse.Codes.VALIDATION_ERROR, 
-            serializer.errors
-        )
 
-    @transaction.atomic
     def put(self, request, pk):
         cert = self.get_object(pk)
-        data = request.data.copy()
-        if 'image' in request.FILES:
-            upload_result = upload_to_cloudinary(request.FILES['image'], folder="cert_images")
-            data['image'] = upload_result.get('secure_url')
-        
-        if 'pdf_file' in request.FILES:
-            upload_result = upload_to_cloudinary(request.FILES['pdf_file'], folder="cert_pdfs")
-            data['pdf_file'] = upload_result.get('secure_url')
-
-        serializer = CertificationSerializer(cert, data=data, partial=True)
-        if serializer.is_valid():
-            serializer.save()
-            return APIResponse.get_success_response(
-                APIResponse.Codes.CERTIFICATION_UPDATED, 
-                serializer.data
+        data = copy.copy(request.data)
+        # Files are uploaded by a background job (see UPLOAD_JOBS)
+        spooled = prepare_uploads(data, request.FILES, self.upload_fields)
+        with spooled_transaction(spooled):
+            serializer = CertificationSerializer(cert, data=data, partial=True)
+            if serializer.is_valid():
+                cert = serializer.save()
+                job = schedule_upload_job(cert, spooled)
+                if job:
+                    return APIResponse.get_success_response(
+                        APIResponse.Codes.CERTIFICATION_UPDATED,
+                        {**serializer.data, 'upload_job': UploadJobSerializer(job).data},
+                        status.HTTP_202_ACCEPTED
+                    )
+                return APIResponse.get_success_response(
+                    APIResponse.Codes.CERTIFICATION_UPDATED, 
+                    serializer.data
+                )
+            discard_spooled(spooled)
+            return APIResponse.get_validation_error_response(
+                APIResponse.Codes.VALIDATION_ERROR, 
+                serializer.errors
             )
-        return APIResponse.get_serializer_error_response(
-            APIResponse.Codes.VALIDATION_ERROR, 
-            serializer.errors
-        )
 
     @transaction.atomic
     def delete(self, request, pk):
@@ -423,21 +589,33 @@ class CertificationView(APIView):
 class EducationView(APIView):
     parser_classes = [MultiPartParser, FormParser, JSONParser]
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    model = Education
+    serializer_class = EducationSerializer
+    retrieved_code = APIResponse.Codes.EDUCATION_RETRIEVED
+    filter_fields = ()
+    ordering_fields = ('start_date', 'end_date', 'created_at')
 
     def get_object(self, pk):
         return get_object_or_404(Education, pk=pk)
 
+    @conditional_get(Education)
+    @cached_response(Education)
     def get(self, request, pk=None):
         if pk:
             education = self.get_object(pk)
-            serializer = EducationSerializer(education)
+            data = EducationSerializer(education).data
         else:
-            educations = Education.objects.all().order_by('-created_at', '-id') 
-            serializer = EducationSerializer(educations, many=True)
+            try:
+                data = get_list_data(
+                    Education, EducationSerializer, request,
+                    self.filter_fields, self.ordering_fields
+                )
+            except InvalidQueryParam as exc:
+                return APIResponse.get_error_response(exc.return_code)
         
         return APIResponse.get_success_response(
             APIResponse.Codes.EDUCATION_RETRIEVED, 
-            serializer.data
+            data
         )
 
     @transaction.atomic
@@ -450,7 +628,7 @@ class EducationView(APIView):
                 serializer.data,
                 status.HTTP_201_CREATED
             )
-        return APIResponse.get_serializer_error_response(
+        return APIResponse.get_validation_error_response(
             APIResponse.Codes.VALIDATION_ERROR, 
             serializer.errors
         )
@@ -465,7 +643,7 @@ class EducationView(APIView):
                 APIResponse.Codes.EDUCATION_UPDATED, 
                 serializer.data
             )
-        return APIResponse.get_serializer_error_response(
+        return APIResponse.get_validation_error_response(
             APIResponse.Codes.VALIDATION_ERROR, 
             serializer.errors
         )
@@ -480,6 +658,8 @@ class EducationView(APIView):
 # ==================== Contact Views ====================
 class ContactView(APIView):
     parser_classes = [MultiPartParser, FormParser, JSONParser]
+    filter_fields = ('email',)
+    ordering_fields = ()
 
     def get_permissions(self):
         """
@@ -491,20 +671,45 @@ class ContactView(APIView):
             return [permissions.AllowAny()]
         return [permissions.IsAdminUser()]
 
+    def get_throttles(self):
+        # Anonymous submissions are rate limited before anything touches the database.
+        if self.request.method == 'POST':
+            return [ContactRateThrottle()]
+        return []
+
+    def handle_exception(self, exc):
+        if isinstance(exc, Throttled):
+            response = APIResponse.get_error_response(
+                APIResponse.Codes.RATE_LIMITED,
+                status.HTTP_429_TOO_MANY_REQUESTS
+            )
+            if exc.wait is not None:
+                response['Retry-After'] = str(math.ceil(exc.wait))
+            return response
+        return super().handle_exception(exc)
+
     def get_object(self, pk):
         return get_object_or_404(Contact, pk=pk)
 
+    @conditional_get(Contact)
+    @cached_response(Contact)
     def get(self, request, pk=None):
         if pk:
             contact = self.get_object(pk)
-            serializer = ContactSerializer(contact)
+            data = ContactSerializer(contact).data
         else:
-            contacts = Contact.objects.all().order_by('-created_at', '-id') 
-            serializer = ContactSerializer(contacts, many=True)
+            # The inbox grows with every form submission, so it is always paginated.
+            try:
+                data = get_list_data(
+                    Contact, ContactSerializer, request,
+                    self.filter_fields, self.ordering_fields, paginate=True
+                )
+            except InvalidQueryParam as exc:
+                return APIResponse.get_error_response(exc.return_code)
         
         return APIResponse.get_success_response(
             APIResponse.Codes.CONTACT_RETRIEVED, 
-            serializer.data
+            data
         )
 
     @transaction.atomic
@@ -517,7 +722,7 @@ class ContactView(APIView):
                 serializer.data,
                 status.HTTP_201_CREATED
             )
-        return APIResponse.get_serializer_error_response(
+        return APIResponse.get_validation_error_response(
             APIResponse.Codes.VALIDATION_ERROR, 
             serializer.errors
         )
@@ -532,7 +737,7 @@ class ContactView(APIView):
                 APIResponse.Codes.CONTACT_UPDATED, 
                 serializer.data
             )
-        return APIResponse.get_serializer_error_response(
+        return APIResponse.get_validation_error_response(
             APIResponse.Codes.VALIDATION_ERROR, 
             serializer.errors
         )
@@ -548,21 +753,33 @@ class ContactView(APIView):
 class ContactInfoView(APIView):
     parser_classes = [MultiPartParser, FormParser, JSONParser]
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    model = ContactInfo
+    serializer_class = ContactInfoSerializer
+    retrieved_code = APIResponse.Codes.CONTACTINFO_RETRIEVED
+    filter_fields = ()
+    ordering_fields = ()
 
     def get_object(self, pk):
         return get_object_or_404(ContactInfo, pk=pk)
 
+    @conditional_get(ContactInfo)
+    @cached_response(ContactInfo)
     def get(self, request, pk=None):
         if pk:
             contact_info = self.get_object(pk)
-            serializer = ContactInfoSerializer(contact_info)
+            data = ContactInfoSerializer(contact_info).data
         else:
-            contact_infos = ContactInfo.objects.all().order_by('-created_at', '-id') 
-            serializer = ContactInfoSerializer(contact_infos, many=True)
+            try:
+                data = get_list_data(
+                    ContactInfo, ContactInfoSerializer, request,
+                    self.filter_fields, self.ordering_fields
+                )
+            except InvalidQueryParam as exc:
+                return APIResponse.get_error_response(exc.return_code)
         
         return APIResponse.get_success_response(
             APIResponse.Codes.CONTACTINFO_RETRIEVED, 
-            serializer.data
+            data
         )
 
     @transaction.atomic
@@ -575,7 +792,7 @@ class ContactInfoView(APIView):
                 serializer.data,
                 status.HTTP_201_CREATED
             )
-        return APIResponse.get_serializer_error_response(
+        return APIResponse.get_validation_error_response(
             APIResponse.Codes.VALIDATION_ERROR, 
             serializer.errors
         )
@@ -590,7 +807,7 @@ class ContactInfoView(APIView):
                 APIResponse.Codes.CONTACTINFO_UPDATED, 
                 serializer.data
             )
-        return APIResponse.get_serializer_error_response(
+        return APIResponse.get_validation_error_response(
             APIResponse.Codes.VALIDATION_ERROR, 
             serializer.errors
         )
@@ -600,3 +817,145 @@ class ContactInfoView(APIView):
         contact_info = self.get_object(pk)
         contact_info.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+# ==================== Portfolio Views ====================
+class PortfolioView(APIView):
+    """
+    Read-only snapshot of every public portfolio section in one response.
+    Clients can limit the document to the sections they render with
+    ?sections=profiles,skills,projects (defaults to all sections).
+    """
+    permission_classes = [permissions.AllowAny]
+    retrieved_code = APIResponse.Codes.PORTFOLIO_RETRIEVED
+    # Query parameters besides the list ones (see api/util/response_cache.py)
+    extra_query_params = ('sections',)
+
+    # section name -> (model, serializer)
+    sections = {
+        'profiles': (Profile, ProfileSerializer),
+        'skills': (Skill, SkillSerializer),
+        'experiences': (Experience, ExperienceSerializer),
+        'projects': (Project, ProjectSerializer),
+        'certifications': (Certification, CertificationSerializer),
+        'education': (Education, EducationSerializer),
+        'contactinfo': (ContactInfo, ContactInfoSerializer),
+    }
+    # Read by @cached_response and the async GET path (see api/util/async_reads.py)
+    response_models = tuple(model for model, _ in sections.values())
+
+    @classmethod
+    def get_requested_sections(cls, request):
+        # A DRF Request, or a plain HttpRequest on the async read path
+        requested = getattr(request, 'query_params', request.GET).get('sections')
+        if not requested:
+            return list(cls.sections)
+        names = [name.strip() for name in requested.split(',') if name.strip()]
+        unknown = [name for name in names if name not in cls.sections]
+        if unknown:
+            return None
+        return names
+
+    @classmethod
+    def get_cache_variant(cls, request):
+        """Only section lists in their canonical order are cached (see api/util/response_cache.py)."""
+        names = cls.get_requested_sections(request)
+        if names is None or names != [name for name in cls.sections if name in names]:
+            return None
+        return ','.join(names)
+
+    def get_validators(self, request):
+        names = self.get_requested_sections(request)
+        if names is None:
+            return None, None
+        return combine_validators(
+            get_validators(self.sections[name][0]) for name in names
+        )
+
+    @classmethod
+    async def aget_validators(cls, request):
+        names = cls.get_requested_sections(request)
+        if names is None:
+            return None, None
+        return combine_validators(
+            [await aget_validators(cls.sections[name][0]) for name in names]
+        )
+
+    @classmethod
+    async def abuild_data(cls, request):
+        """The document of get(), over the async ORM; None for unknown sections."""
+        names = cls.get_requested_sections(request)
+        if names is None:
+            return None
+        return {name: await aget_list_data(*cls.sections[name]) for name in names}
+
+    @conditional_get()
+    @cached_response(*response_models)
+    def get(self, request):
+        names = self.get_requested_sections(request)
+        if names is None:
+            return APIResponse.get_error_response(APIResponse.Codes.INVALID_SECTION)
+
+        document = {}
+        for name in names:
+            model, serializer_class = self.sections[name]
+            document[name] = get_list_data(model, serializer_class)
+
+        return APIResponse.get_success_response(self.retrieved_code, document)
+
+
+
+# ==================== Upload Job Views ====================
+class UploadJobView(APIView):
+    """Status of a background upload started by a write request."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, pk):
+        job = get_object_or_404(UploadJob, pk=pk)
+        return APIResponse.get_success_response(
+            APIResponse.Codes.UPLOAD_JOB_RETRIEVED,
+            UploadJobSerializer(job).data
+        )
+
+
+# ==================== Metrics Views ====================
+class MetricsView(APIView):
+    """Runtime counters for verifying the performance layers (admin only)."""
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return APIResponse.get_success_response(
+            APIResponse.Codes.METRICS_RETRIEVED,
+            {
+                'payload_cache': payload_cache.stats(),
+                'media_dedup': dedup_report(),
+                'db_pool': get_pool_stats(),
+                'auth_token_cache': token_cache.stats(),
+                'token_blacklist': blacklist_index.stats(),
+            }
+        )
+
+
+# ==================== Media Views ====================
+def media_file(request, path):
+    """
+    Serve a file kept by LocalMediaStorage.
+
+    File names are content hashes, so a name never changes content and the
+    response may be cached forever. With MEDIA_ACCEL_REDIRECT_PREFIX set, only
+    an X-Accel-Redirect header is returned and the proxy sends the file itself.
+    """
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404
+    if not os.path.isfile(full_path):
+        raise Http404
+
+    if settings.MEDIA_ACCEL_REDIRECT_PREFIX:
+        response = HttpResponse(content_type=mimetypes.guess_type(full_path)[0] or 'application/octet-stream')
+        response['X-Accel-Redirect'] = f"{settings.MEDIA_ACCEL_REDIRECT_PREFIX.rstrip('/')}/{path}"
+    else:
+        response = FileResponse(open(full_path, 'rb'))
+    response['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 from datetime import timedelta
 from pathlib import Path
+from urllib.parse import unquote, urlsplit
 from dotenv import load_dotenv
 import os
 import dj_database_url
@@ -123,6 +124,55 @@ DATABASES = {
     }
 }
 
+# Connection reuse. With DB_POOL=True (the default) connections come from
+# psycopg's connection pool, checked before each checkout; otherwise every
+# worker keeps its connection open for DB_CONN_MAX_AGE seconds, with health
+# checks. Django doesn't allow combining the two.
+if os.getenv('DB_POOL', 'True') == 'True':
+    from psycopg_pool import ConnectionPool
+
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': int(os.getenv('DB_POOL_MIN_SIZE', 2)),
+        'max_size': int(os.getenv('DB_POOL_MAX_SIZE', 10)),
+        # Seconds a request may wait for a free connection before erroring
+        'timeout': float(os.getenv('DB_POOL_TIMEOUT', 10)),
+        'max_idle': float(os.getenv('DB_POOL_MAX_IDLE', 600)),
+        'max_lifetime': float(os.getenv('DB_POOL_MAX_LIFETIME', 3600)),
+        'check': ConnectionPool.check_connection,
+    }
+else:
+    DATABASES['default']['CONN_MAX_AGE'] = int(os.getenv('DB_CONN_MAX_AGE', 60))
+    DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
+# Read replicas, e.g. DATABASE_REPLICA_URLS=postgres://...@replica-1/db,postgres://...@replica-2/db
+# Safe /api/ requests read from a random replica; see api/util/replicas.py.
+_replica_urls = [url.strip() for url in os.getenv('DATABASE_REPLICA_URLS', '').split(',') if url.strip()]
+for _index, _url in enumerate(_replica_urls):
+    _replica = dj_database_url.parse(_url)
+    if _replica['ENGINE'] == DATABASES['default']['ENGINE']:
+        # Same sslmode / pool / persistent connection settings as the primary
+        _replica['OPTIONS'] = {**DATABASES['default']['OPTIONS'], **_replica.get('OPTIONS', {})}
+        _replica['CONN_MAX_AGE'] = DATABASES['default'].get('CONN_MAX_AGE', 0)
+        _replica['CONN_HEALTH_CHECKS'] = DATABASES['default'].get('CONN_HEALTH_CHECKS', False)
+    _replica['TEST'] = {'MIRROR': 'default'}
+    DATABASES[f'replica_{_index}'] = _replica
+
+DATABASE_REPLICAS = {
+    'ALIASES': [f'replica_{_index}' for _index in range(len(_replica_urls))],
+    'PATH_PREFIX': '/api/',
+    # Reads stay on the primary this long after a client's own write...
+    'STICKY_SECONDS': int(os.getenv('REPLICA_STICKY_SECONDS', 5)),
+    # ...and after any write to a model, for every client (replication lag)
+    'LAG_SECONDS': int(os.getenv('REPLICA_LAG_SECONDS', 5)),
+    # Use the shared cache (when REDIS_URL is set) so this holds across workers;
+    # without it each worker only knows about the writes it handled itself.
+    'CACHE_ALIAS': 'shared' if os.getenv('REDIS_URL') else 'default',
+}
+
+if DATABASE_REPLICAS['ALIASES']:
+    DATABASE_ROUTERS = ['api.util.replicas.ReplicaRouter']
+    MIDDLEWARE.append('api.util.replicas.ReplicaRoutingMiddleware')
+
 
 
 # Password validation
@@ -163,23 +213,78 @@ STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
-# MEDIA_URL = '/media/'
-# MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+# Media storage
+# Uploaded files go to Cloudinary by default. With
+# MEDIA_STORAGE_BACKEND=api.util.storage.LocalMediaStorage they are kept under
+# MEDIA_ROOT instead, content-addressed, and served by the API itself
+# (or by the reverse proxy when MEDIA_ACCEL_REDIRECT_PREFIX is set).
+MEDIA_STORAGE_BACKEND = os.getenv('MEDIA_STORAGE_BACKEND', 'api.util.storage.CloudinaryMediaStorage')
+MEDIA_URL = '/media/'
+MEDIA_ROOT = os.getenv('MEDIA_ROOT', os.path.join(BASE_DIR, 'media'))
+# Absolute origin used to build the stored URLs of locally stored files
+MEDIA_PUBLIC_BASE_URL = os.getenv('MEDIA_PUBLIC_BASE_URL', 'http://localhost:8000')
+# e.g. '/protected-media/' for an nginx `internal` location aliased to MEDIA_ROOT
+MEDIA_ACCEL_REDIRECT_PREFIX = os.getenv('MEDIA_ACCEL_REDIRECT_PREFIX', '')
 
 # Cloudinary Storage
-import cloudinary
-import cloudinary.uploader
-import cloudinary.api
+# CLOUDINARY_URL has the form cloudinary://<api_key>:<api_secret>@<cloud_name>
+_cloudinary_url = urlsplit(os.getenv('CLOUDINARY_URL', ''))
 
 CLOUDINARY_STORAGE = {
-    'CLOUD_NAME': os.getenv('CLOUDINARY_URL', '').split('@')[1] if '@' in os.getenv('CLOUDINARY_URL', '') else '',
-    'API_KEY': os.getenv('CLOUDINARY_URL', '').split('://')[1].split(':')[0] if '://' in os.getenv('CLOUDINARY_URL', '') else '',
-    'API_SECRET': os.getenv('CLOUDINARY_URL', '').split(':')[2].split('@')[0] if ':' in os.getenv('CLOUDINARY_URL', '') else '',
+    'CLOUD_NAME': _cloudinary_url.netloc.rpartition('@')[2] if _cloudinary_url.username else '',
+    'API_KEY': unquote(_cloudinary_url.username or ''),
+    'API_SECRET': unquote(_cloudinary_url.password or ''),
+}
+
+# Cloudinary client (see api/util/cloudinary_client.py): timeouts of the SDK's
+# API calls, and the pool for existence checks of stored assets.
+CLOUDINARY_CLIENT = {
+    'POOL_MAXSIZE': int(os.getenv('CLOUDINARY_POOL_MAXSIZE', 10)),
+    'CONNECT_TIMEOUT': float(os.getenv('CLOUDINARY_CONNECT_TIMEOUT', 5)),
+    'READ_TIMEOUT': float(os.getenv('CLOUDINARY_READ_TIMEOUT', 60)),
+    'RETRIES': int(os.getenv('CLOUDINARY_RETRIES', 2)),
+    'RETRY_BACKOFF': float(os.getenv('CLOUDINARY_RETRY_BACKOFF', 0.5)),
 }
 
 
 DEFAULT_FILE_STORAGE = 'cloudinary_storage.storage.MediaCloudinaryStorage'
 
+# Streaming uploads: multipart files are written to the upload spool in
+# CHUNK_SIZE pieces instead of being buffered in memory, and oversized uploads
+# are rejected with a 413 before the body is read. Files larger than
+# REMOTE_CHUNK_SIZE go to Cloudinary through its chunked upload API.
+FILE_UPLOAD_HANDLERS = ['api.util.upload_handlers.SpoolingUploadHandler']
+
+UPLOAD_STREAMING = {
+    'CHUNK_SIZE': int(os.getenv('UPLOAD_CHUNK_SIZE', 64 * 1024)),
+    'MAX_FILE_SIZE': int(os.getenv('UPLOAD_MAX_FILE_SIZE', 20 * 1024 * 1024)),
+    'MAX_REQUEST_SIZE': int(os.getenv('UPLOAD_MAX_REQUEST_SIZE', 50 * 1024 * 1024)),
+    # Cloudinary requires chunks of at least 5 MB
+    'REMOTE_CHUNK_SIZE': int(os.getenv('UPLOAD_REMOTE_CHUNK_SIZE', 6 * 1024 * 1024)),
+}
+
+# Background uploads: write requests spool files here and return 202 with an
+# upload job id; a worker thread pool uploads them and patches the URL fields.
+# Set UPLOAD_JOBS_ASYNC=False to upload inside the request instead.
+UPLOAD_JOBS = {
+    'ASYNC': os.getenv('UPLOAD_JOBS_ASYNC', 'True') == 'True',
+    'MAX_WORKERS': int(os.getenv('UPLOAD_JOBS_MAX_WORKERS', 2)),
+    'SPOOL_DIR': os.getenv('UPLOAD_SPOOL_DIR', str(BASE_DIR / 'upload_spool')),
+    # Jobs run in-process; ones left PENDING/RUNNING this long (their worker
+    # exited) are marked FAILED.
+    'STALE_AFTER_SECONDS': int(os.getenv('UPLOAD_JOBS_STALE_AFTER_SECONDS', 60 * 60)),
+}
+
+# Resized WebP/AVIF copies of uploaded images (profile_picture, logo, image),
+# rendered by the upload job in a process pool and stored next to the original.
+IMAGE_VARIANTS = {
+    'ENABLED': os.getenv('IMAGE_VARIANTS_ENABLED', 'True') == 'True',
+    'WIDTHS': [int(width) for width in os.getenv('IMAGE_VARIANT_WIDTHS', '320,640,1280').split(',')],
+    'FORMATS': os.getenv('IMAGE_VARIANT_FORMATS', 'webp,avif').split(','),
+    'QUALITY': int(os.getenv('IMAGE_VARIANT_QUALITY', 80)),
+    'MAX_WORKERS': int(os.getenv('IMAGE_VARIANT_MAX_WORKERS', 2)),
+}
+
 
 
 
@@ -231,6 +336,41 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',  # Default permission
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'api.util.renderers.FastJSONRenderer',  # orjson when installed, else DRF's JSONRenderer
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    # Error envelope for exceptions such as UploadTooLarge
+    'EXCEPTION_HANDLER': 'api.util.responses.api_exception_handler',
+    # Reverse proxies in front of the app. Throttles take the client IP from
+    # X-Forwarded-For only this many hops deep; with 0 they use REMOTE_ADDR
+    # and never trust the (client-controlled) header.
+    'NUM_PROXIES': int(os.getenv('NUM_PROXIES', 0)),
+}
+
+# Serve public GETs of the resource endpoints with native async views
+# (async ORM and cache). Only worth enabling under an ASGI server, e.g.
+# gunicorn -k uvicorn.workers.UvicornWorker portfolio_backend.asgi:application
+API_ASYNC_VIEWS = os.getenv('API_ASYNC_VIEWS', 'False') == 'True'
+
+# Token bucket rate limits (api/util/throttling.py): BURST requests at once,
+# refilled at PER_HOUR, per client IP and per submitted email. With REDIS_URL
+# the buckets are shared across workers.
+API_RATE_LIMIT = {
+    'ENABLED': os.getenv('API_RATE_LIMIT_ENABLED', 'True') == 'True',
+    'LOCAL_MAX_ENTRIES': int(os.getenv('API_RATE_LIMIT_LOCAL_MAX_ENTRIES', 10000)),
+    'SHARED_CACHE_ALIAS': 'shared' if os.getenv('REDIS_URL') else None,
+    'CONTACT': {
+        'BURST': int(os.getenv('CONTACT_RATE_LIMIT_BURST', 5)),
+        'PER_HOUR': int(os.getenv('CONTACT_RATE_LIMIT_PER_HOUR', 20)),
+    },
+}
+
+# Keyset pagination (always on for the contact inbox, opt-in elsewhere via
+# ?cursor= / ?page_size=)
+API_PAGINATION = {
+    'PAGE_SIZE': int(os.getenv('API_PAGE_SIZE', 20)),
+    'MAX_PAGE_SIZE': int(os.getenv('API_MAX_PAGE_SIZE', 100)),
 }
 
 SIMPLE_JWT = {
@@ -243,6 +383,47 @@ SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('Bearer',),
 }
 
+# SafeJWTAuthentication: verified access tokens (and their user) are cached
+# per worker for TOKEN_CACHE_TTL seconds. SKIP_ON_PUBLIC_READS leaves safe
+# requests to public views unauthenticated, as their response is the same
+# for everyone.
+API_AUTH = {
+    'TOKEN_CACHE_ENABLED': os.getenv('API_AUTH_TOKEN_CACHE_ENABLED', 'True') == 'True',
+    'TOKEN_CACHE_TTL': int(os.getenv('API_AUTH_TOKEN_CACHE_TTL', 60)),
+    'TOKEN_CACHE_MAX_ENTRIES': int(os.getenv('API_AUTH_TOKEN_CACHE_MAX_ENTRIES', 1024)),
+    'SKIP_ON_PUBLIC_READS': os.getenv('API_AUTH_SKIP_ON_PUBLIC_READS', 'False') == 'True',
+    # In-memory index of blacklisted refresh tokens: how often other workers'
+    # logouts are picked up, and how often expired token rows are deleted.
+    'BLACKLIST_REFRESH_SECONDS': int(os.getenv('API_AUTH_BLACKLIST_REFRESH_SECONDS', 30)),
+}
+
+# =========================
+# Caching
+# =========================
+# Each worker keeps a local LRU of serialized list payloads. Setting REDIS_URL
+# adds a shared backend (requires the `redis` package) so payloads and cache
+# versions are shared across workers and invalidation reaches all of them.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+if os.getenv('REDIS_URL'):
+    CACHES['shared'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv('REDIS_URL'),
+    }
+
+API_CACHE = {
+    'ENABLED': os.getenv('API_CACHE_ENABLED', 'True') == 'True',
+    'LOCAL_MAX_ENTRIES': int(os.getenv('API_CACHE_LOCAL_MAX_ENTRIES', 256)),
+    # Without a shared backend other workers don't see version bumps, so
+    # local entries expire after this many seconds.
+    'LOCAL_TTL': int(os.getenv('API_CACHE_LOCAL_TTL', 5)),
+    'SHARED_CACHE_ALIAS': 'shared' if os.getenv('REDIS_URL') else None,
+    'TIMEOUT': int(os.getenv('API_CACHE_TIMEOUT', 60 * 60 * 24)),
+}
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -17,13 +17,12 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
-from django.conf.urls.static import static
+
+from api.views import media_file
 
 urlpatterns = [
     path('admin/', admin.site.urls), # This is your Admin Panel
     path('api/', include('api.urls')), # This is your API
+    # Files kept by LocalMediaStorage (in every environment, not just DEBUG)
+    path(f"{settings.MEDIA_URL.strip('/')}/<path:path>", media_file, name='media-file'),
 ]
-
-# This allows images to load during development
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file